@@ -29,8 +29,9 @@ from iajson.auth.oauth import (
 from iajson.auth.register import AgentInfo, Credentials
 from iajson.auth.signer import create_signed_headers, sign
 from iajson.client import Endpoint, IaJsonClient, Parameter, SiteInfo
-from iajson.discovery import adiscover, discover
+from iajson.discovery import adiscover, clear_discovery_cache, discover
 from iajson.exceptions import (
+    EMPTY_DETAILS,
     AuthenticationError,
     DiscoveryError,
     IaJsonError,
@@ -50,6 +51,7 @@ __all__ = [
     # Discovery
     "discover",
     "adiscover",
+    "clear_discovery_cache",
     # Auth -- signer
     "sign",
     "create_signed_headers",
@@ -67,4 +69,5 @@ __all__ = [
     "AuthenticationError",
     "DiscoveryError",
     "RateLimitError",
+    "EMPTY_DETAILS",
 ]
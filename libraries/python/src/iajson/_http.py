@@ -0,0 +1,173 @@
+"""Shared ``httpx`` clients for the module-level auth helpers.
+
+The one-shot helpers in :mod:`iajson.auth` (token exchange, refresh,
+registration and verification) would otherwise build a throwaway
+connection pool -- and pay a fresh TCP + TLS handshake -- on every call.
+The clients here are created lazily on first use and kept for the
+lifetime of the process so keep-alive connections are reused.
+
+``httpx.AsyncClient`` instances are bound to the event loop they were
+first used on, so one async client is kept per running loop.
+
+The shared clients serve every caller in the process, so they never
+store cookies: a ``Set-Cookie`` from one tenant's token response must
+not be sent with another tenant's request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import http.cookiejar
+import importlib.util
+import threading
+import weakref
+from collections.abc import Awaitable, Iterable
+from typing import TypeVar
+
+import httpx
+
+_T = TypeVar("_T")
+
+#: Whether the optional ``h2`` package is installed.  HTTP/2 is only
+#: enabled on the shared clients when it is (``pip install iajson[http2]``).
+HTTP2_AVAILABLE: bool = importlib.util.find_spec("h2") is not None
+
+#: Client-level default timeout.  Callers pass their own per request.
+_DEFAULT_TIMEOUT: float = 30.0
+
+#: Keep idle connections around long enough to span bursts of token
+#: refreshes against the same host.
+_LIMITS = httpx.Limits(max_keepalive_connections=32, keepalive_expiry=300.0)
+
+#: Default cap on concurrent requests for the batch helpers.
+DEFAULT_MAX_INFLIGHT: int = 32
+
+_lock = threading.Lock()
+_sync_client: httpx.Client | None = None
+_async_clients: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, httpx.AsyncClient
+] = weakref.WeakKeyDictionary()
+
+
+class _RejectAllCookies(http.cookiejar.CookiePolicy):
+    """Cookie policy that neither accepts nor returns any cookie."""
+
+    netscape = True
+    rfc2965 = False
+    hide_cookie2 = False
+
+    def set_ok(self, cookie: http.cookiejar.Cookie, request: object) -> bool:
+        return False
+
+    def return_ok(self, cookie: http.cookiejar.Cookie, request: object) -> bool:
+        return False
+
+    def domain_return_ok(self, domain: str, request: object) -> bool:
+        return False
+
+    def path_return_ok(self, path: str, request: object) -> bool:
+        return False
+
+
+def cookieless_jar() -> http.cookiejar.CookieJar:
+    """Return a cookie jar that silently drops every ``Set-Cookie``.
+
+    Pass it as ``cookies=`` to clients that are reused across unrelated
+    requests, so no cookie set by one response rides along on the next.
+    """
+    return http.cookiejar.CookieJar(policy=_RejectAllCookies())
+
+
+def get_client() -> httpx.Client:
+    """Return the process-wide synchronous client, creating it on first use."""
+    global _sync_client
+    client = _sync_client
+    if client is None or client.is_closed:
+        with _lock:
+            client = _sync_client
+            if client is None or client.is_closed:
+                client = _sync_client = httpx.Client(
+                    timeout=_DEFAULT_TIMEOUT,
+                    limits=_LIMITS,
+                    http2=HTTP2_AVAILABLE,
+                    cookies=cookieless_jar(),
+                )
+    return client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Return the asynchronous client for the running event loop,
+    creating it on first use.
+
+    Must be called from within a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        with _lock:
+            client = _async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = _async_clients[loop] = httpx.AsyncClient(
+                    timeout=_DEFAULT_TIMEOUT,
+                    limits=_LIMITS,
+                    http2=HTTP2_AVAILABLE,
+                    cookies=cookieless_jar(),
+                )
+    return client
+
+
+def close_shared_clients() -> None:
+    """Close the shared synchronous client.
+
+    A new client is created transparently on the next call, so this is
+    mainly useful for test teardown and clean interpreter shutdown.
+    """
+    global _sync_client
+    with _lock:
+        client, _sync_client = _sync_client, None
+    if client is not None:
+        client.close()
+
+
+async def aclose_shared_clients() -> None:
+    """Close the shared asynchronous client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        client = _async_clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def gather_bounded(
+    aws: Iterable[Awaitable[_T]],
+    *,
+    max_inflight: int,
+) -> list[_T | BaseException]:
+    """Await *aws* concurrently with at most *max_inflight* in flight.
+
+    Results are returned in input order.  A failing awaitable does not
+    cancel the others; its exception is returned in its slot instead.
+    A cancelled child comes back as :class:`asyncio.CancelledError`,
+    which is a :class:`BaseException` but not an :class:`Exception`.
+    """
+    semaphore = asyncio.Semaphore(max_inflight)
+
+    async def _bounded(aw: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(
+        *(_bounded(aw) for aw in aws), return_exceptions=True,
+    )
+
+
+__all__ = [
+    "HTTP2_AVAILABLE",
+    "DEFAULT_MAX_INFLIGHT",
+    "get_client",
+    "get_async_client",
+    "close_shared_clients",
+    "aclose_shared_clients",
+    "gather_bounded",
+    "cookieless_jar",
+]
@@ -0,0 +1,41 @@
+"""JSON encoding and decoding with an optional fast backend.
+
+Uses `orjson <https://github.com/ijl/orjson>`_ when it is installed
+(``pip install iajson[orjson]``) and the standard library otherwise.
+:func:`loads` takes the raw response ``bytes``, so neither backend needs
+a separate text-decoding pass first; :func:`dumps` returns compact UTF-8
+``bytes`` ready to send.  Decode errors are :class:`ValueError`
+subclasses with either backend.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised without the extra
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize *obj* to compact JSON."""
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def loads(data: bytes | bytearray | str) -> Any:
+        """Parse a JSON document."""
+        return json.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize *obj* to compact JSON."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+__all__ = [
+    "loads",
+    "dumps",
+]
@@ -5,10 +5,15 @@ Sub-modules
 - **signer** -- HMAC request signing (``signed_key`` auth).
 - **register** -- Agent registration flow.
 - **oauth** -- OAuth2 helpers for ``user_required`` endpoints.
+
+The network helpers share one keep-alive ``httpx`` client per process
+(and one per event loop for the async variants); see
+:func:`close_shared_clients` / :func:`aclose_shared_clients`.
 """
 
 from __future__ import annotations
 
+from iajson._http import aclose_shared_clients, close_shared_clients
 from iajson.auth.oauth import (
     OAuth2Config,
     PKCEChallenge,
@@ -36,4 +41,7 @@ __all__ = [
     "generate_pkce_challenge",
     "build_authorization_url",
     "exchange_code",
+    # shared HTTP clients
+    "close_shared_clients",
+    "aclose_shared_clients",
 ]
@@ -11,16 +11,39 @@ PKCE (Proof Key for Code Exchange) is supported and recommended.
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
-import secrets
+import os
+from collections.abc import Iterable
 from dataclasses import dataclass, field
-from urllib.parse import urlencode
 
 import httpx
 
+from iajson import _json
+from iajson._http import (
+    DEFAULT_MAX_INFLIGHT,
+    gather_bounded,
+    get_async_client,
+    get_client,
+)
 from iajson.exceptions import AuthenticationError, IaJsonError
 
 
+@functools.lru_cache(maxsize=64)
+def _shared_str(value: str) -> str:
+    """Return one canonical instance of *value*.
+
+    Token responses repeat the same ``token_type`` and ``scope`` strings,
+    so long-lived agents holding many tokens keep one copy of each
+    instead of one per response.  Bounded, unlike :func:`sys.intern`.
+    """
+    return value
+
+
+#: Grant types assumed when ``auth.oauth2.grant_types`` is absent.
+_DEFAULT_GRANT_TYPES: tuple[str, ...] = ("authorization_code",)
+
+
 @dataclass(frozen=True, slots=True)
 class OAuth2Config:
     """Parsed OAuth2 configuration from an ia.json file."""
@@ -28,19 +51,22 @@ class OAuth2Config:
     authorization_url: str
     token_url: str
     scopes: dict[str, str]
-    grant_types: list[str] = field(default_factory=lambda: ["authorization_code"])
+    grant_types: list[str] = field(default_factory=lambda: list(_DEFAULT_GRANT_TYPES))
     pkce_required: bool = False
 
     @classmethod
     def from_dict(cls, data: dict) -> OAuth2Config:
         """Create an :class:`OAuth2Config` from the ``auth.oauth2``
         section of a parsed ia.json file."""
+        grant_types = data.get("grant_types")
+        if grant_types is None:
+            grant_types = list(_DEFAULT_GRANT_TYPES)
         return cls(
-            authorization_url=data["authorization_url"],
-            token_url=data["token_url"],
-            scopes=data["scopes"],
-            grant_types=data.get("grant_types", ["authorization_code"]),
-            pkce_required=data.get("pkce_required", False),
+            data["authorization_url"],
+            data["token_url"],
+            data["scopes"],
+            grant_types,
+            data.get("pkce_required", False),
         )
 
 
@@ -63,6 +89,41 @@ class TokenResponse:
     refresh_token: str | None = None
     scope: str | None = None
 
+    @classmethod
+    def _from_raw(cls, data: dict) -> TokenResponse:
+        """Build from a parsed token endpoint response.
+
+        Token parsing runs on every exchange and refresh, so this fills
+        the slots directly rather than going through the generated
+        keyword ``__init__``.
+        """
+        get = data.get
+        token_type = get("token_type") or "Bearer"
+        if isinstance(token_type, str):
+            token_type = _shared_str(token_type)
+        scope = get("scope")
+        if isinstance(scope, str):
+            scope = _shared_str(scope)
+
+        self = object.__new__(cls)
+        self.access_token = data["access_token"]
+        self.token_type = token_type
+        self.expires_in = get("expires_in")
+        self.refresh_token = get("refresh_token")
+        self.scope = scope
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class ExchangeRequest:
+    """A single authorization-code exchange for :func:`aexchange_codes`."""
+
+    client_id: str
+    client_secret: str
+    code: str
+    redirect_uri: str
+    code_verifier: str | None = None
+
 
 def generate_pkce_challenge() -> PKCEChallenge:
     """Generate a PKCE code-verifier and S256 code-challenge.
@@ -70,10 +131,16 @@ def generate_pkce_challenge() -> PKCEChallenge:
     Returns:
         A :class:`PKCEChallenge` instance.
     """
-    verifier = secrets.token_urlsafe(48)
-    digest = hashlib.sha256(verifier.encode("ascii")).digest()
-    challenge = base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
-    return PKCEChallenge(verifier=verifier, challenge=challenge)
+    # 48 random bytes encode to exactly 64 base64 characters with no
+    # padding, so the encoded bytes can be hashed as-is instead of
+    # decoding to str and re-encoding.  (``secrets.token_bytes`` is a
+    # thin wrapper around ``os.urandom``.)
+    verifier = base64.urlsafe_b64encode(os.urandom(48))
+    digest = hashlib.sha256(verifier).digest()
+    # A SHA-256 digest is always 32 bytes, which encodes to 44 characters
+    # ending in exactly one "=" of padding.
+    challenge = base64.urlsafe_b64encode(digest)[:-1].decode("ascii")
+    return PKCEChallenge(verifier=verifier.decode("ascii"), challenge=challenge)
 
 
 def build_authorization_url(
@@ -103,20 +170,20 @@ def build_authorization_url(
     Returns:
         The fully-formed authorization URL.
     """
-    params: dict[str, str] = {
-        "response_type": "code",
-        "client_id": client_id,
-        "redirect_uri": redirect_uri,
-        "scope": " ".join(scopes or list(config.scopes.keys())),
-    }
+    url = _authorization_url_prefix(
+        config.authorization_url,
+        client_id,
+        redirect_uri,
+        " ".join(scopes if scopes else config.scopes),
+    )
     if state is not None:
-        params["state"] = state
+        url = f"{url}&state={_quote_param(state)}"
     if pkce is not None:
-        params["code_challenge"] = pkce.challenge
-        params["code_challenge_method"] = pkce.method
-
-    separator = "&" if "?" in config.authorization_url else "?"
-    return f"{config.authorization_url}{separator}{urlencode(params)}"
+        url = (
+            f"{url}&code_challenge={_quote_param(pkce.challenge)}"
+            f"&code_challenge_method={_quote_param(pkce.method)}"
+        )
+    return url
 
 
 def exchange_code(
@@ -146,18 +213,17 @@ def exchange_code(
     Raises:
         AuthenticationError: If the token exchange fails.
     """
-    payload: dict[str, str] = {
-        "grant_type": "authorization_code",
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "code": code,
-        "redirect_uri": redirect_uri,
-    }
-    if code_verifier is not None:
-        payload["code_verifier"] = code_verifier
+    payload = _exchange_payload(
+        client_id, client_secret, code, redirect_uri, code_verifier,
+    )
 
     try:
-        response = httpx.post(config.token_url, data=payload, timeout=timeout)
+        response = get_client().post(
+            config.token_url,
+            content=payload,
+            headers=_FORM_HEADERS,
+            timeout=timeout,
+        )
     except httpx.HTTPError as exc:
         raise IaJsonError(f"Token exchange failed: {exc}") from exc
 
@@ -168,7 +234,7 @@ def exchange_code(
             status_code=response.status_code,
         )
 
-    return _parse_token_response(response.json())
+    return _parse_token_response(_json.loads(response.content))
 
 
 async def aexchange_code(
@@ -198,21 +264,17 @@ async def aexchange_code(
     Raises:
         AuthenticationError: If the token exchange fails.
     """
-    payload: dict[str, str] = {
-        "grant_type": "authorization_code",
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "code": code,
-        "redirect_uri": redirect_uri,
-    }
-    if code_verifier is not None:
-        payload["code_verifier"] = code_verifier
+    payload = _exchange_payload(
+        client_id, client_secret, code, redirect_uri, code_verifier,
+    )
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                config.token_url, data=payload, timeout=timeout,
-            )
+        response = await get_async_client().post(
+            config.token_url,
+            content=payload,
+            headers=_FORM_HEADERS,
+            timeout=timeout,
+        )
     except httpx.HTTPError as exc:
         raise IaJsonError(f"Token exchange failed: {exc}") from exc
 
@@ -223,7 +285,7 @@ async def aexchange_code(
             status_code=response.status_code,
         )
 
-    return _parse_token_response(response.json())
+    return _parse_token_response(_json.loads(response.content))
 
 
 def refresh_token(
@@ -249,15 +311,15 @@ def refresh_token(
     Raises:
         AuthenticationError: If the refresh fails.
     """
-    payload: dict[str, str] = {
-        "grant_type": "refresh_token",
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "refresh_token": refresh,
-    }
+    payload = _refresh_payload(client_id, client_secret, refresh)
 
     try:
-        response = httpx.post(config.token_url, data=payload, timeout=timeout)
+        response = get_client().post(
+            config.token_url,
+            content=payload,
+            headers=_FORM_HEADERS,
+            timeout=timeout,
+        )
     except httpx.HTTPError as exc:
         raise IaJsonError(f"Token refresh failed: {exc}") from exc
 
@@ -268,7 +330,7 @@ def refresh_token(
             status_code=response.status_code,
         )
 
-    return _parse_token_response(response.json())
+    return _parse_token_response(_json.loads(response.content))
 
 
 async def arefresh_token(
@@ -294,18 +356,15 @@ async def arefresh_token(
     Raises:
         AuthenticationError: If the refresh fails.
     """
-    payload: dict[str, str] = {
-        "grant_type": "refresh_token",
-        "client_id": client_id,
-        "client_secret": client_secret,
-        "refresh_token": refresh,
-    }
+    payload = _refresh_payload(client_id, client_secret, refresh)
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                config.token_url, data=payload, timeout=timeout,
-            )
+        response = await get_async_client().post(
+            config.token_url,
+            content=payload,
+            headers=_FORM_HEADERS,
+            timeout=timeout,
+        )
     except httpx.HTTPError as exc:
         raise IaJsonError(f"Token refresh failed: {exc}") from exc
 
@@ -316,32 +375,224 @@ async def arefresh_token(
             status_code=response.status_code,
         )
 
-    return _parse_token_response(response.json())
+    return _parse_token_response(_json.loads(response.content))
+
+
+def warmup(config: OAuth2Config, *, timeout: float = 10.0) -> None:
+    """Open a connection to the token endpoint ahead of time (sync).
+
+    Sends a bodiless ``OPTIONS`` request to ``config.token_url`` so the
+    TCP + TLS handshake is done (and, with HTTP/2, a multiplexed
+    connection is ready) before the first exchange or refresh.  This is
+    best-effort: network errors are ignored and will surface on the real
+    request instead.
+
+    Args:
+        config: The OAuth2 configuration from ia.json.
+        timeout: HTTP request timeout in seconds.
+    """
+    try:
+        get_client().options(config.token_url, timeout=timeout)
+    except httpx.HTTPError:
+        pass
+
+
+async def awarmup(config: OAuth2Config, *, timeout: float = 10.0) -> None:
+    """Async variant of :func:`warmup`.
+
+    Args:
+        config: The OAuth2 configuration from ia.json.
+        timeout: HTTP request timeout in seconds.
+    """
+    try:
+        await get_async_client().options(config.token_url, timeout=timeout)
+    except httpx.HTTPError:
+        pass
+
+
+async def aexchange_codes(
+    config: OAuth2Config,
+    requests: Iterable[ExchangeRequest],
+    *,
+    timeout: float = 30.0,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT,
+) -> list[TokenResponse | BaseException]:
+    """Exchange many authorization codes concurrently.
+
+    All requests share one connection pool and at most *max_inflight*
+    are in flight at once.
+
+    Args:
+        config: The OAuth2 configuration from ia.json.
+        requests: The exchanges to perform.
+        timeout: HTTP request timeout in seconds, per request.
+        max_inflight: Maximum number of concurrent requests.
+
+    Returns:
+        One entry per request, in input order: a :class:`TokenResponse`
+        on success, or the exception :func:`aexchange_code` raised.
+    """
+    return await gather_bounded(
+        (
+            aexchange_code(
+                config,
+                client_id=req.client_id,
+                client_secret=req.client_secret,
+                code=req.code,
+                redirect_uri=req.redirect_uri,
+                code_verifier=req.code_verifier,
+                timeout=timeout,
+            )
+            for req in requests
+        ),
+        max_inflight=max_inflight,
+    )
+
+
+async def arefresh_tokens(
+    config: OAuth2Config,
+    refreshes: Iterable[str],
+    *,
+    client_id: str,
+    client_secret: str,
+    timeout: float = 30.0,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT,
+) -> list[TokenResponse | BaseException]:
+    """Refresh many OAuth2 access tokens concurrently.
+
+    Args:
+        config: The OAuth2 configuration from ia.json.
+        refreshes: The refresh tokens.
+        client_id: Your application's client ID.
+        client_secret: Your application's client secret.
+        timeout: HTTP request timeout in seconds, per request.
+        max_inflight: Maximum number of concurrent requests.
+
+    Returns:
+        One entry per refresh token, in input order: a
+        :class:`TokenResponse` on success, or the exception
+        :func:`arefresh_token` raised.
+    """
+    return await gather_bounded(
+        (
+            arefresh_token(
+                config,
+                client_id=client_id,
+                client_secret=client_secret,
+                refresh=refresh,
+                timeout=timeout,
+            )
+            for refresh in refreshes
+        ),
+        max_inflight=max_inflight,
+    )
 
 
 # -----------------------------------------------------------------------
 # Internal helpers
 # -----------------------------------------------------------------------
 
+#: Bytes that form encoding leaves untouched -- the same set
+#: :func:`urllib.parse.quote_plus` treats as always safe.  Used for both
+#: token request bodies and authorization URL query strings.
+_FORM_SAFE = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    b"abcdefghijklmnopqrstuvwxyz"
+    b"0123456789_.-~"
+)
+
+#: Encoded form of every byte value: itself if safe, ``+`` for a space,
+#: ``%XX`` otherwise.
+_FORM_TABLE: tuple[bytes, ...] = tuple(
+    bytes((b,)) if b in _FORM_SAFE else b"+" if b == 0x20 else b"%%%02X" % b
+    for b in range(256)
+)
+
+_FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+_EXCHANGE_PREFIX = b"grant_type=authorization_code&client_id="
+_REFRESH_PREFIX = b"grant_type=refresh_token&client_id="
+
+
+@functools.lru_cache(maxsize=128)
+def _authorization_url_prefix(
+    authorization_url: str,
+    client_id: str,
+    redirect_uri: str,
+    scope: str,
+) -> str:
+    """Return the authorization URL up to and including the ``scope``
+    parameter.  These parts rarely change between calls for the same
+    application, unlike ``state`` and the PKCE challenge."""
+    separator = "&" if "?" in authorization_url else "?"
+    return (
+        f"{authorization_url}{separator}response_type=code"
+        f"&client_id={_quote_param(client_id)}"
+        f"&redirect_uri={_quote_param(redirect_uri)}"
+        f"&scope={_quote_param(scope)}"
+    )
+
+
+def _form_quote(value: str) -> bytes:
+    """Form-encode a single value, byte-for-byte identical to
+    :func:`urllib.parse.quote_plus` with ``safe=""``."""
+    raw = value.encode("utf-8")
+    if not raw.translate(None, _FORM_SAFE):
+        return raw
+    return b"".join(map(_FORM_TABLE.__getitem__, raw))
+
+
+def _quote_param(value: str) -> str:
+    """Query-string variant of :func:`_form_quote`."""
+    return _form_quote(value).decode("ascii")
+
+
+def _exchange_payload(
+    client_id: str,
+    client_secret: str,
+    code: str,
+    redirect_uri: str,
+    code_verifier: str | None,
+) -> bytes:
+    """Build the form-encoded ``authorization_code`` grant body."""
+    parts = [
+        _EXCHANGE_PREFIX, _form_quote(client_id),
+        b"&client_secret=", _form_quote(client_secret),
+        b"&code=", _form_quote(code),
+        b"&redirect_uri=", _form_quote(redirect_uri),
+    ]
+    if code_verifier is not None:
+        parts += (b"&code_verifier=", _form_quote(code_verifier))
+    return b"".join(parts)
+
+
+def _refresh_payload(client_id: str, client_secret: str, refresh: str) -> bytes:
+    """Build the form-encoded ``refresh_token`` grant body."""
+    return b"".join((
+        _REFRESH_PREFIX, _form_quote(client_id),
+        b"&client_secret=", _form_quote(client_secret),
+        b"&refresh_token=", _form_quote(refresh),
+    ))
+
+
 def _parse_token_response(data: dict) -> TokenResponse:
     """Parse a raw JSON token response into a :class:`TokenResponse`."""
-    return TokenResponse(
-        access_token=data["access_token"],
-        token_type=data.get("token_type", "Bearer"),
-        expires_in=data.get("expires_in"),
-        refresh_token=data.get("refresh_token"),
-        scope=data.get("scope"),
-    )
+    return TokenResponse._from_raw(data)
 
 
 __all__ = [
     "OAuth2Config",
     "PKCEChallenge",
     "TokenResponse",
+    "ExchangeRequest",
     "generate_pkce_challenge",
     "build_authorization_url",
     "exchange_code",
     "aexchange_code",
+    "aexchange_codes",
     "refresh_token",
     "arefresh_token",
+    "arefresh_tokens",
+    "warmup",
+    "awarmup",
 ]
@@ -11,10 +11,17 @@ specification (Section 5.1):
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 import httpx
 
+from iajson._http import (
+    DEFAULT_MAX_INFLIGHT,
+    gather_bounded,
+    get_async_client,
+    get_client,
+)
 from iajson.exceptions import AuthenticationError, IaJsonError
 
 
@@ -70,7 +77,7 @@ def register(
         payload["description"] = agent_info.description
 
     try:
-        response = httpx.post(register_url, json=payload, timeout=timeout)
+        response = get_client().post(register_url, json=payload, timeout=timeout)
     except httpx.HTTPError as exc:
         raise IaJsonError(
             f"Registration request failed: {exc}",
@@ -117,10 +124,9 @@ async def aregister(
         payload["description"] = agent_info.description
 
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                register_url, json=payload, timeout=timeout,
-            )
+        response = await get_async_client().post(
+            register_url, json=payload, timeout=timeout,
+        )
     except httpx.HTTPError as exc:
         raise IaJsonError(
             f"Registration request failed: {exc}",
@@ -161,7 +167,7 @@ def verify(
         IaJsonError: On network or unexpected errors.
     """
     try:
-        response = httpx.post(
+        response = get_client().post(
             verify_url,
             json={"verification_code": verification_code},
             timeout=timeout,
@@ -209,12 +215,11 @@ async def averify(
         IaJsonError: On network or unexpected errors.
     """
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                verify_url,
-                json={"verification_code": verification_code},
-                timeout=timeout,
-            )
+        response = await get_async_client().post(
+            verify_url,
+            json={"verification_code": verification_code},
+            timeout=timeout,
+        )
     except httpx.HTTPError as exc:
         raise IaJsonError(
             f"Verification request failed: {exc}",
@@ -237,6 +242,32 @@ async def averify(
     )
 
 
+async def averify_many(
+    verifications: Iterable[tuple[str, str]],
+    *,
+    timeout: float = 30.0,
+    max_inflight: int = DEFAULT_MAX_INFLIGHT,
+) -> list[Credentials | BaseException]:
+    """Run many verifications (steps 3 and 4) concurrently.
+
+    Args:
+        verifications: ``(verify_url, verification_code)`` pairs.
+        timeout: HTTP request timeout in seconds, per request.
+        max_inflight: Maximum number of concurrent requests.
+
+    Returns:
+        One entry per pair, in input order: the :class:`Credentials` on
+        success, or the exception :func:`averify` raised.
+    """
+    return await gather_bounded(
+        (
+            averify(verify_url, verification_code, timeout=timeout)
+            for verify_url, verification_code in verifications
+        ),
+        max_inflight=max_inflight,
+    )
+
+
 __all__ = [
     "AgentInfo",
     "Credentials",
@@ -244,4 +275,5 @@ __all__ = [
     "aregister",
     "verify",
     "averify",
+    "averify_many",
 ]
@@ -14,16 +14,103 @@ For GET requests with no body the signing string is::
 
 from __future__ import annotations
 
+import functools
 import hashlib
 import hmac
+import re
 import time
 from typing import Literal
 
+from iajson.exceptions import IaJsonError
+
+#: A request body: text, or the exact bytes sent on the wire.
+_Body = str | bytes | bytearray | memoryview
+
+#: The signature header format: the lowercase hex that ``hexdigest()``
+#: produces.
+_HEX_DIGEST_RE = re.compile(r"[0-9a-f]+")
+
+#: Hash constructors for the ``auth.signed_key.algorithm`` values allowed
+#: by the schema.
+_HASH_FUNCS = {
+    "sha256": hashlib.sha256,
+    "sha512": hashlib.sha512,
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _hmac_template(secret: str, algorithm: str) -> hmac.HMAC:
+    """Return an HMAC keyed with *secret* that has not been fed any data.
+
+    Keying an HMAC hashes the padded secret into its inner and outer
+    states.  Callers ``copy()`` the cached template instead of repeating
+    that work (and the secret's UTF-8 encode) for every signature made
+    with the same credentials.
+    """
+    try:
+        hash_func = _HASH_FUNCS[algorithm]
+    except KeyError:
+        raise IaJsonError(
+            f"Unsupported signing algorithm '{algorithm}' "
+            f"(expected one of: {', '.join(_HASH_FUNCS)})"
+        ) from None
+    return hmac.new(secret.encode("utf-8"), None, hash_func)
+
+
+@functools.lru_cache(maxsize=16)
+def _header_names(prefix: str) -> tuple[str, str, str]:
+    """Return the ``(key, signature, timestamp)`` header names for *prefix*."""
+    return f"{prefix}Key", f"{prefix}Signature", f"{prefix}Timestamp"
+
+
+#: ``(seconds, str(seconds), b"{seconds}.")`` for the most recent second
+#: a default timestamp was taken in.  Bursts of signed requests within
+#: the same second reuse the formatted values.
+_ts_cache: tuple[int, str, bytes] = (0, "0", b"0.")
+
+
+def _current_timestamp() -> tuple[int, str, bytes]:
+    """Return the current Unix time as ``(int, str, signing prefix)``."""
+    global _ts_cache
+    now = time.time_ns() // 1_000_000_000
+    cached = _ts_cache
+    if cached[0] != now:
+        cached = _ts_cache = (now, str(now), b"%d." % now)
+    return cached
+
+
+def _mac(
+    secret: str,
+    ts_prefix: bytes,
+    body: _Body,
+    algorithm: str,
+) -> hmac.HMAC:
+    """Return the HMAC of ``ts_prefix + body``, where *ts_prefix* is
+    ``b"{timestamp}."``.
+
+    The two parts are fed to the HMAC separately so a bytes-like body is
+    hashed in place, without being copied into a joined signing string.
+    """
+    mac = _hmac_template(secret, algorithm).copy()
+    mac.update(ts_prefix)
+    mac.update(body.encode("utf-8") if isinstance(body, str) else body)
+    return mac
+
+
+def _sign(secret: str, ts_prefix: bytes, body: _Body, algorithm: str) -> str:
+    """Return the hex-encoded signature (see :func:`_mac`)."""
+    return _mac(secret, ts_prefix, body, algorithm).hexdigest()
+
+
+def _sign_raw(secret: str, ts_prefix: bytes, body: _Body, algorithm: str) -> bytes:
+    """Return the raw signature digest (see :func:`_mac`)."""
+    return _mac(secret, ts_prefix, body, algorithm).digest()
+
 
 def sign(
     secret: str,
     timestamp: int,
-    body: str,
+    body: _Body,
     *,
     algorithm: Literal["sha256", "sha512"] = "sha256",
 ) -> str:
@@ -32,26 +119,22 @@ def sign(
     Args:
         secret: The shared secret issued during registration.
         timestamp: Unix timestamp in seconds.
-        body: The raw request body string.  Use an empty string for GET
-            requests with no body.
+        body: The raw request body, as a string or as the UTF-8 bytes
+            that will be sent (``bytes``, ``bytearray`` or
+            ``memoryview``; bytes-like bodies are hashed without being
+            copied).  Use an empty string for GET requests with no body.
         algorithm: The HMAC algorithm to use (``"sha256"`` or ``"sha512"``).
 
     Returns:
         The hex-encoded HMAC signature.
     """
-    hash_func = hashlib.sha256 if algorithm == "sha256" else hashlib.sha512
-    signing_string = f"{timestamp}.{body}"
-    return hmac.new(
-        secret.encode("utf-8"),
-        signing_string.encode("utf-8"),
-        hash_func,
-    ).hexdigest()
+    return _sign(secret, b"%d." % timestamp, body, algorithm)
 
 
 def create_signed_headers(
     api_key: str,
     secret: str,
-    body: str,
+    body: _Body,
     *,
     prefix: str = "X-IA-",
     algorithm: Literal["sha256", "sha512"] = "sha256",
@@ -67,8 +150,8 @@ def create_signed_headers(
     Args:
         api_key: The API key issued during registration.
         secret: The shared secret issued during registration.
-        body: The raw request body string.  Use an empty string for GET
-            requests with no body.
+        body: The raw request body, as a string or bytes-like object.
+            Use an empty string for GET requests with no body.
         prefix: The header prefix declared in the ia.json ``auth.signed_key``
             section.  Defaults to ``"X-IA-"``.
         algorithm: The HMAC algorithm to use (``"sha256"`` or ``"sha512"``).
@@ -79,19 +162,23 @@ def create_signed_headers(
         A dictionary with three headers: ``{prefix}Key``,
         ``{prefix}Signature``, and ``{prefix}Timestamp``.
     """
-    ts = timestamp if timestamp is not None else int(time.time())
-    signature = sign(secret, ts, body, algorithm=algorithm)
+    if timestamp is None:
+        _, ts_str, ts_prefix = _current_timestamp()
+    else:
+        ts_str, ts_prefix = str(timestamp), b"%d." % timestamp
+    signature = _sign(secret, ts_prefix, body, algorithm)
+    key_header, signature_header, timestamp_header = _header_names(prefix)
     return {
-        f"{prefix}Key": api_key,
-        f"{prefix}Signature": signature,
-        f"{prefix}Timestamp": str(ts),
+        key_header: api_key,
+        signature_header: signature,
+        timestamp_header: ts_str,
     }
 
 
 def verify_signature(
     secret: str,
     timestamp: int,
-    body: str,
+    body: _Body,
     expected_signature: str,
     *,
     algorithm: Literal["sha256", "sha512"] = "sha256",
@@ -107,18 +194,28 @@ def verify_signature(
         secret: The shared secret for the agent.
         timestamp: The timestamp from the request header.
         body: The raw request body.
-        expected_signature: The signature from the request header.
+        expected_signature: The signature from the request header, as
+            the lowercase hex that :func:`sign` returns.
         algorithm: The HMAC algorithm.
         max_age_seconds: Maximum acceptable age of the timestamp.
 
     Returns:
         ``True`` if the signature is valid and the timestamp is fresh.
     """
-    now = int(time.time())
-    if abs(now - timestamp) > max_age_seconds:
+    # Reject stale or future timestamps before touching the body, so
+    # replayed requests cost O(1) rather than an HMAC over the body.
+    delta = time.time_ns() // 1_000_000_000 - timestamp
+    if delta > max_age_seconds or delta < -max_age_seconds:
+        return False
+    # Accept exactly what sign() produces: lowercase hex and nothing
+    # else.  fromhex() alone would also take uppercase and whitespace.
+    if _HEX_DIGEST_RE.fullmatch(expected_signature) is None:
         return False
-    computed = sign(secret, timestamp, body, algorithm=algorithm)
-    return hmac.compare_digest(computed, expected_signature)
+    # Compare raw digests: half the bytes of the hex form, and the
+    # computed digest never needs hex-encoding.  A wrong length simply
+    # compares unequal.
+    computed = _sign_raw(secret, b"%d." % timestamp, body, algorithm)
+    return hmac.compare_digest(computed, bytes.fromhex(expected_signature))
 
 
 __all__ = [
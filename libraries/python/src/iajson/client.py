@@ -14,14 +14,18 @@ Typical usage::
 
 from __future__ import annotations
 
-import json
+import asyncio
 import re
-import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from functools import cached_property
+from types import MappingProxyType
 from typing import Any, Literal
 
 import httpx
 
+from iajson import _json
+from iajson._http import HTTP2_AVAILABLE, cookieless_jar
 from iajson.auth.register import AgentInfo, Credentials
 from iajson.auth.register import register as _register_agent
 from iajson.auth.register import aregister as _aregister_agent
@@ -57,19 +61,26 @@ class Parameter:
 
     @classmethod
     def from_dict(cls, name: str, data: dict) -> Parameter:
-        """Create a :class:`Parameter` from a raw ia.json dict entry."""
-        return cls(
-            name=name,
-            type=data.get("type", "string"),
-            required=data.get("required", False),
-            description=data.get("description", ""),
-            default=data.get("default"),
-            example=data.get("example"),
-            enum=data.get("enum"),
-            min=data.get("min"),
-            max=data.get("max"),
-            pattern=data.get("pattern"),
-        )
+        """Create a :class:`Parameter` from a raw ia.json dict entry.
+
+        Documents can declare hundreds of parameters, so this fills the
+        slots directly rather than going through the generated frozen
+        ``__init__``.
+        """
+        get = data.get
+        self = object.__new__(cls)
+        _set = object.__setattr__
+        _set(self, "name", name)
+        _set(self, "type", get("type", "string"))
+        _set(self, "required", get("required", False))
+        _set(self, "description", get("description", ""))
+        _set(self, "default", get("default"))
+        _set(self, "example", get("example"))
+        _set(self, "enum", get("enum"))
+        _set(self, "min", get("min"))
+        _set(self, "max", get("max"))
+        _set(self, "pattern", get("pattern"))
+        return self
 
 
 @dataclass(frozen=True, slots=True)
@@ -87,6 +98,11 @@ class Endpoint:
     scopes: list[str] = field(default_factory=list)
     deprecated: bool = False
 
+    @property
+    def has_path_params(self) -> bool:
+        """Whether ``path`` contains any ``{name}`` placeholders."""
+        return _PATH_PARAM_RE.search(self.path) is not None
+
     @classmethod
     def from_dict(
         cls,
@@ -94,27 +110,32 @@ class Endpoint:
         data: dict,
         level: Literal["public", "protected", "user_required"],
     ) -> Endpoint:
-        """Create an :class:`Endpoint` from a raw ia.json dict entry."""
-        parameters = [
-            Parameter.from_dict(pname, pdata)
-            for pname, pdata in (data.get("parameters") or {}).items()
-        ]
-        body_fields = [
-            Parameter.from_dict(pname, pdata)
-            for pname, pdata in (data.get("body") or {}).items()
-        ]
-        return cls(
-            name=name,
-            method=data["method"],
-            path=data["path"],
-            description=data["description"],
-            level=level,
-            parameters=parameters,
-            body_fields=body_fields,
-            rate_limit=data.get("rate_limit"),
-            scopes=data.get("scopes", []),
-            deprecated=data.get("deprecated", False),
-        )
+        """Create an :class:`Endpoint` from a raw ia.json dict entry.
+
+        Like :meth:`Parameter.from_dict`, this fills the slots directly.
+        """
+        get = data.get
+        from_dict = Parameter.from_dict
+        parameters = get("parameters")
+        body = get("body")
+
+        self = object.__new__(cls)
+        _set = object.__setattr__
+        _set(self, "name", name)
+        _set(self, "method", data["method"])
+        _set(self, "path", data["path"])
+        _set(self, "description", data["description"])
+        _set(self, "level", level)
+        _set(self, "parameters", [
+            from_dict(pname, pdata) for pname, pdata in parameters.items()
+        ] if parameters else [])
+        _set(self, "body_fields", [
+            from_dict(pname, pdata) for pname, pdata in body.items()
+        ] if body else [])
+        _set(self, "rate_limit", get("rate_limit"))
+        _set(self, "scopes", get("scopes", []))
+        _set(self, "deprecated", get("deprecated", False))
+        return self
 
 
 @dataclass(frozen=True, slots=True)
@@ -154,33 +175,78 @@ class SiteInfo:
 _PATH_PARAM_RE = re.compile(r"\{(\w+)\}")
 
 
-def _resolve_path(path: str, params: dict[str, Any]) -> tuple[str, dict[str, Any]]:
-    """Substitute ``{name}`` placeholders in *path* with values from
-    *params*.  Returns the resolved path and a copy of *params* with
-    the consumed keys removed.
+#: A path split around its placeholders: ``(parts, names)``.
+_SplitPath = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _split_path(path: str) -> _SplitPath:
+    """Split *path* around its ``{name}`` placeholders.
+
+    Returns:
+        ``(parts, names)``: the literal segments (always one more than
+        the names) and the placeholder names, in order.
     """
-    remaining = dict(params)
-    def _replacer(match: re.Match) -> str:
-        key = match.group(1)
-        if key in remaining:
-            value = remaining.pop(key)
-            return str(value)
-        return match.group(0)
+    # With one capture group, split() alternates literal and name:
+    # [lit0, name0, lit1, ..., litN].
+    pieces = _PATH_PARAM_RE.split(path)
+    return tuple(pieces[0::2]), tuple(pieces[1::2])
 
-    resolved = _PATH_PARAM_RE.sub(_replacer, path)
-    return resolved, remaining
+
+def _resolve_path(split: _SplitPath, params: dict[str, Any]) -> str:
+    """Substitute the ``{name}`` placeholders of a path, pre-split by
+    :func:`_split_path`, with values from *params*.
+
+    Consumed keys are popped from *params* in place, leaving only the
+    query / body parameters.  Placeholders without a matching parameter
+    are left as-is.
+    """
+    parts, names = split
+    resolved = [parts[0]]
+    for i, name in enumerate(names, 1):
+        if name in params:
+            resolved.append(str(params.pop(name)))
+        else:
+            resolved.append(f"{{{name}}}")
+        resolved.append(parts[i])
+    return "".join(resolved)
 
 
 # -----------------------------------------------------------------------
 # Client
 # -----------------------------------------------------------------------
 
+#: Endpoint access levels, in the order they appear in ``api``.
+_LEVELS: tuple[str, ...] = ("public", "protected", "user_required")
+
+#: Headers for a JSON request body when no auth headers are added.
+#: ``httpx`` copies request headers, so one read-only instance is shared.
+_JSON_CT_HEADERS: Mapping[str, str] = MappingProxyType(
+    {"Content-Type": "application/json"}
+)
+
+#: Connection-pool limits for the per-client ``httpx`` clients.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+#: Placeholder returned by :meth:`IaJsonClient.register` while the
+#: webhook verification is pending.  Always the same object, so callers
+#: can test ``creds is _PENDING_CREDENTIALS``.
+_PENDING_CREDENTIALS = Credentials(api_key="", secret="")
+
+
 class IaJsonClient:
     """High-level client for a single ia.json-enabled site.
 
     Instances are usually created via the :meth:`discover` or
     :meth:`adiscover` class methods, which handle fetching and parsing
     the ia.json file automatically.
+
+    Each instance keeps a persistent connection pool, created on first
+    use, so consecutive calls reuse keep-alive connections.  Use the
+    client as a (async) context manager, or call :meth:`close` /
+    :meth:`aclose`, to release it.  ``httpx`` async pools are bound to
+    an event loop, so the async pool is replaced transparently when the
+    client is used from a different loop (e.g. a later
+    ``asyncio.run()``).
     """
 
     def __init__(
@@ -207,14 +273,33 @@ class IaJsonClient:
         self._secret: str | None = secret
         self._access_token: str | None = access_token
         self._timeout: float = timeout
-
-        # Parse structural data eagerly.
+        self._http: httpx.Client | None = None
+        self._ahttp: httpx.AsyncClient | None = None
+        # The event loop ``_ahttp`` belongs to.
+        self._aloop: asyncio.AbstractEventLoop | None = None
+
+        # Cheap structural data is read eagerly.  Site metadata and the
+        # endpoint table are parsed on first use (see the cached
+        # properties below), so clients that never touch them skip it.
         self._base_url: str = document["api"]["base_url"]
-        self._site: SiteInfo = SiteInfo.from_dict(document["site"])
+        # Endpoint paths start with "/", so drop any trailing slash once
+        # here rather than normalising every request URL.
+        self._url_prefix: str = self._base_url.rstrip("/")
         self._auth_config: dict = document.get("auth", {})
         self._security_config: dict = document.get("security", {})
         self._capabilities: dict[str, bool] = document.get("capabilities", {})
-        self._endpoints: dict[str, Endpoint] = self._parse_endpoints(document)
+        self._capabilities_view: Mapping[str, bool] = MappingProxyType(
+            self._capabilities
+        )
+
+        # Resolve signing settings once rather than on every signed call.
+        signed_key_config: dict = self._auth_config.get("signed_key", {})
+        self._sk_algorithm: Literal["sha256", "sha512"] = signed_key_config.get(
+            "algorithm", "sha256",
+        )
+        self._sk_prefix: str = signed_key_config.get("header_prefix", "X-IA-")
+        self._sig_header_name: str = f"{self._sk_prefix}Signature"
+        self._ts_header_name: str = f"{self._sk_prefix}Timestamp"
 
     # -------------------------------------------------------------------
     # Factory class-methods
@@ -242,14 +327,23 @@ class IaJsonClient:
         Returns:
             A configured :class:`IaJsonClient` instance.
         """
-        document = _discover(domain, timeout=timeout)
-        return cls(
+        # Fetch with the client's own pool so the connection can be
+        # reused by subsequent calls.
+        http = cls._new_client(timeout)
+        try:
+            document = _discover(domain, timeout=timeout, client=http)
+        except BaseException:
+            http.close()
+            raise
+        client = cls(
             document,
             api_key=api_key,
             secret=secret,
             access_token=access_token,
             timeout=timeout,
         )
+        client._http = http
+        return client
 
     @classmethod
     async def adiscover(
@@ -275,14 +369,59 @@ class IaJsonClient:
         Returns:
             A configured :class:`IaJsonClient` instance.
         """
-        document = await _adiscover(domain, timeout=timeout)
-        return cls(
+        http = cls._new_async_client(timeout)
+        try:
+            document = await _adiscover(domain, timeout=timeout, client=http)
+        except BaseException:
+            await http.aclose()
+            raise
+        client = cls(
             document,
             api_key=api_key,
             secret=secret,
             access_token=access_token,
             timeout=timeout,
         )
+        client._ahttp = http
+        client._aloop = asyncio.get_running_loop()
+        return client
+
+    # -------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------
+
+    def close(self) -> None:
+        """Close the synchronous connection pool, if one was opened.
+
+        The client remains usable; a new pool is opened on the next call.
+        """
+        if self._http is not None:
+            self._http.close()
+            self._http = None
+
+    async def aclose(self) -> None:
+        """Close both the asynchronous and synchronous connection pools.
+
+        An async pool left over from another event loop cannot be closed
+        from this one; it is dropped instead.
+        """
+        http, self._ahttp = self._ahttp, None
+        loop, self._aloop = self._aloop, None
+        if http is not None and loop is asyncio.get_running_loop():
+            await http.aclose()
+        self.close()
+
+    def __enter__(self) -> IaJsonClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> IaJsonClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
 
     # -------------------------------------------------------------------
     # Public properties
@@ -293,10 +432,10 @@ class IaJsonClient:
         """The raw ia.json document."""
         return self._document
 
-    @property
+    @cached_property
     def site(self) -> SiteInfo:
         """Parsed site metadata."""
-        return self._site
+        return SiteInfo.from_dict(self._document["site"])
 
     @property
     def base_url(self) -> str:
@@ -304,9 +443,10 @@ class IaJsonClient:
         return self._base_url
 
     @property
-    def capabilities(self) -> dict[str, bool]:
-        """The capabilities flags from the ia.json file."""
-        return dict(self._capabilities)
+    def capabilities(self) -> Mapping[str, bool]:
+        """The capabilities flags from the ia.json file, as a read-only
+        mapping."""
+        return self._capabilities_view
 
     @property
     def version(self) -> str:
@@ -317,6 +457,36 @@ class IaJsonClient:
     # Endpoint introspection
     # -------------------------------------------------------------------
 
+    @cached_property
+    def _endpoints(self) -> dict[str, Endpoint]:
+        """All endpoints keyed by name, parsed on first use."""
+        return self._parse_endpoints(self._document)
+
+    @cached_property
+    def _endpoints_by_level(self) -> dict[str, list[Endpoint]]:
+        """The endpoints bucketed by access level, in table order."""
+        by_level: dict[str, list[Endpoint]] = {level: [] for level in _LEVELS}
+        for endpoint in self._endpoints.values():
+            by_level[endpoint.level].append(endpoint)
+        return by_level
+
+    @cached_property
+    def _path_splits(self) -> dict[str, _SplitPath]:
+        """The split form of every endpoint path that has placeholders,
+        keyed by path, so each is split once per client rather than on
+        every call."""
+        splits: dict[str, _SplitPath] = {}
+        for endpoint in self._endpoints.values():
+            split = _split_path(endpoint.path)
+            if split[1]:
+                splits[endpoint.path] = split
+        return splits
+
+    @cached_property
+    def _endpoint_names_sorted(self) -> str:
+        """Comma-separated endpoint names, for error messages."""
+        return ", ".join(sorted(self._endpoints))
+
     def get_endpoints(
         self,
         level: str | None = None,
@@ -332,7 +502,7 @@ class IaJsonClient:
             A list of :class:`Endpoint` objects.
         """
         if level is not None:
-            return [ep for ep in self._endpoints.values() if ep.level == level]
+            return list(self._endpoints_by_level.get(level, ()))
         return list(self._endpoints.values())
 
     def get_endpoint(self, name: str) -> Endpoint:
@@ -350,9 +520,9 @@ class IaJsonClient:
         try:
             return self._endpoints[name]
         except KeyError:
-            available = ", ".join(sorted(self._endpoints.keys()))
             raise IaJsonError(
-                f"Unknown endpoint '{name}'. Available endpoints: {available}"
+                f"Unknown endpoint '{name}'. "
+                f"Available endpoints: {self._endpoint_names_sorted}"
             )
 
     # -------------------------------------------------------------------
@@ -396,8 +566,10 @@ class IaJsonClient:
             agent_info: Metadata about the AI agent.
 
         Returns:
-            Intermediate response data.  The ``Credentials`` are fully
-            populated only after :meth:`complete_registration`.
+            A shared, empty placeholder :class:`Credentials` instance
+            (the same object on every call, so it can be recognised by
+            identity; do not mutate it).  The real credentials are
+            returned by :meth:`complete_registration`.
 
         Raises:
             IaJsonError: If no ``signed_key`` auth is configured.
@@ -413,7 +585,7 @@ class IaJsonClient:
 
         # The verification code arrives asynchronously via webhook.
         # Return a placeholder; callers use complete_registration() next.
-        return Credentials(api_key="", secret="")
+        return _PENDING_CREDENTIALS
 
     def complete_registration(
         self,
@@ -441,11 +613,12 @@ class IaJsonClient:
         self._secret = creds.secret
         return creds
 
-    def sign(self, body: str = "") -> tuple[str, int]:
+    def sign(self, body: str | bytes = "") -> tuple[str, int]:
         """Compute a request signature for *body*.
 
         Args:
-            body: The raw request body.  Use an empty string for GET
+            body: The raw request body, as a string or as the exact
+                bytes that will be sent.  Use an empty string for GET
                 requests.
 
         Returns:
@@ -457,21 +630,16 @@ class IaJsonClient:
         if not self._secret:
             raise IaJsonError("No secret configured; call set_credentials() first")
 
-        signed_key_config = self._auth_config.get("signed_key", {})
-        algorithm = signed_key_config.get("algorithm", "sha256")
-        prefix = signed_key_config.get("header_prefix", "X-IA-")
-
-        ts = int(time.time())
+        # Let the signer read the clock (it caches the formatted
+        # timestamp per second) and take the value back from its headers.
         headers = create_signed_headers(
             self._api_key or "",
             self._secret,
             body,
-            prefix=prefix,
-            algorithm=algorithm,
-            timestamp=ts,
+            prefix=self._sk_prefix,
+            algorithm=self._sk_algorithm,
         )
-        signature = headers[f"{prefix}Signature"]
-        return signature, ts
+        return headers[self._sig_header_name], int(headers[self._ts_header_name])
 
     # -------------------------------------------------------------------
     # API call
@@ -512,8 +680,9 @@ class IaJsonClient:
             endpoint, params, access_token=access_token,
         )
 
-        with httpx.Client(timeout=self._timeout) as http:
-            response = http.request(endpoint.method, url, headers=headers, **request_kwargs)
+        response = self._get_client().request(
+            endpoint.method, url, headers=headers, **request_kwargs,
+        )
 
         return self._handle_response(response)
 
@@ -541,10 +710,9 @@ class IaJsonClient:
             endpoint, params, access_token=access_token,
         )
 
-        async with httpx.AsyncClient(timeout=self._timeout) as http:
-            response = await http.request(
-                endpoint.method, url, headers=headers, **request_kwargs,
-            )
+        response = await self._get_async_client().request(
+            endpoint.method, url, headers=headers, **request_kwargs,
+        )
 
         return self._handle_response(response)
 
@@ -552,13 +720,57 @@ class IaJsonClient:
     # Internal helpers
     # -------------------------------------------------------------------
 
+    @staticmethod
+    def _new_client(timeout: float) -> httpx.Client:
+        """Create a pooled synchronous ``httpx`` client.
+
+        The pool outlives individual calls, so it never stores cookies:
+        each request goes out exactly as the caller built it, and a
+        ``Set-Cookie`` from the site's ``/ia.json`` is not replayed.
+        """
+        return httpx.Client(
+            timeout=timeout,
+            limits=_HTTP_LIMITS,
+            http2=HTTP2_AVAILABLE,
+            cookies=cookieless_jar(),
+        )
+
+    @staticmethod
+    def _new_async_client(timeout: float) -> httpx.AsyncClient:
+        """Asynchronous counterpart of :meth:`_new_client`."""
+        return httpx.AsyncClient(
+            timeout=timeout,
+            limits=_HTTP_LIMITS,
+            http2=HTTP2_AVAILABLE,
+            cookies=cookieless_jar(),
+        )
+
+    def _get_client(self) -> httpx.Client:
+        """Return this instance's synchronous client, opening it lazily."""
+        if self._http is None:
+            self._http = self._new_client(self._timeout)
+        return self._http
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return this instance's asynchronous client for the running
+        event loop, opening it lazily.
+
+        A pool created on another loop is unusable here (its connections
+        belong to that loop), so a new one is opened in its place.
+        """
+        loop = asyncio.get_running_loop()
+        if self._ahttp is None or self._aloop is not loop:
+            self._ahttp = self._new_async_client(self._timeout)
+            self._aloop = loop
+        return self._ahttp
+
     @staticmethod
     def _parse_endpoints(document: dict) -> dict[str, Endpoint]:
         """Parse all endpoints from a raw ia.json document into a flat
         name-keyed dictionary."""
         endpoints: dict[str, Endpoint] = {}
         api = document["api"]
-        for level in ("public", "protected", "user_required"):
+        for level in _LEVELS:
             group = api.get(level)
             if not group:
                 continue
@@ -572,51 +784,63 @@ class IaJsonClient:
         params: dict[str, Any],
         *,
         access_token: str | None = None,
-    ) -> tuple[str, dict[str, str], dict[str, Any]]:
+    ) -> tuple[str, Mapping[str, str] | None, dict[str, Any]]:
         """Build the URL, headers, and ``httpx`` request kwargs for an
         endpoint call.
 
         Returns:
-            A ``(url, headers, request_kwargs)`` tuple.
+            A ``(url, headers, request_kwargs)`` tuple.  ``headers`` is
+            ``None`` when the request needs no extra headers.
         """
-        # Resolve path parameters.
-        resolved_path, remaining = _resolve_path(endpoint.path, params)
-        url = f"{self._base_url}{resolved_path}"
+        # Resolve path parameters.  *params* is the caller's fresh
+        # ``**params`` dict, so path values are popped from it directly.
+        # Flat paths have no entry and are used as-is.
+        split = self._path_splits.get(endpoint.path)
+        if split is not None:
+            resolved_path = _resolve_path(split, params)
+        else:
+            resolved_path = endpoint.path
+        remaining = params
+        url = self._url_prefix + resolved_path
 
         # Build request body / query params.
         request_kwargs: dict[str, Any] = {}
-        body_str = ""
+        # The body stays as the encoded bytes: the same object is sent by
+        # httpx and hashed by the signer, with no str round trip.
+        body = b""
         if endpoint.method in ("POST", "PUT", "PATCH", "DELETE") and remaining:
-            body_str = json.dumps(remaining, separators=(",", ":"))
-            request_kwargs["content"] = body_str
-            request_kwargs["headers"] = {"Content-Type": "application/json"}
+            body = _json.dumps(remaining)
+            request_kwargs["content"] = body
         elif remaining:
             request_kwargs["params"] = remaining
 
-        # Authentication headers.
-        headers: dict[str, str] = {}
+        # Authentication headers.  Public calls without a body send no
+        # extra headers at all, so the dict is only built when needed.
+        headers: dict[str, str] | None = None
 
         if endpoint.level in ("protected", "user_required"):
             # signed_key auth
             if self._api_key and self._secret:
-                signed_key_config = self._auth_config.get("signed_key", {})
-                algorithm = signed_key_config.get("algorithm", "sha256")
-                prefix = signed_key_config.get("header_prefix", "X-IA-")
-                headers.update(
-                    create_signed_headers(
-                        self._api_key,
-                        self._secret,
-                        body_str,
-                        prefix=prefix,
-                        algorithm=algorithm,
-                    )
+                headers = create_signed_headers(
+                    self._api_key,
+                    self._secret,
+                    body,
+                    prefix=self._sk_prefix,
+                    algorithm=self._sk_algorithm,
                 )
 
         if endpoint.level == "user_required":
             token = access_token or self._access_token
             if token:
+                if headers is None:
+                    headers = {}
                 headers["Authorization"] = f"Bearer {token}"
 
+        if body:
+            if headers is None:
+                return url, _JSON_CT_HEADERS, request_kwargs
+            headers["Content-Type"] = "application/json"
+
         return url, headers, request_kwargs
 
     @staticmethod
@@ -627,46 +851,50 @@ class IaJsonClient:
         Returns:
             The parsed JSON response body.
         """
-        if response.status_code == 429:
-            retry_after_raw = response.headers.get("Retry-After")
-            retry_after: float | None = None
-            if retry_after_raw is not None:
-                try:
-                    retry_after = float(retry_after_raw)
-                except ValueError:
-                    pass
-            raise RateLimitError(
-                f"Rate limit exceeded: {response.text}",
-                retry_after=retry_after,
+        status = response.status_code
+        content = response.content
+
+        # Success is the common case: no error checks and no text decode.
+        if status < 400:
+            if not content:
+                return {}
+            return _json.loads(content)
+
+        # The body is decoded once, and only to build the error message,
+        # honouring the charset the response declares.
+        text = content.decode(response.encoding or "utf-8", errors="replace")
+
+        if status == 429:
+            # Report the server's delay as-is: no default, no jitter.
+            raise RateLimitError.from_response(
+                response,
+                message=f"Rate limit exceeded: {text}",
+                default=None,
+                jitter=0.0,
             )
 
-        if response.status_code in (401, 403):
+        if status in (401, 403):
             error_code: str | None = None
             try:
-                error_body = response.json()
+                error_body = _json.loads(content)
                 error_code = error_body.get("error", {}).get("code")
             except (ValueError, AttributeError):
                 pass
             raise AuthenticationError(
-                f"Authentication failed (HTTP {response.status_code}): {response.text}",
+                f"Authentication failed (HTTP {status}): {text}",
                 error_code=error_code,
-                status_code=response.status_code,
-            )
-
-        if response.status_code >= 400:
-            raise IaJsonError(
-                f"API error (HTTP {response.status_code}): {response.text}",
-                details={"status_code": response.status_code},
+                status_code=status,
             )
 
-        if not response.content:
-            return {}
-
-        return response.json()
+        raise IaJsonError(
+            f"API error (HTTP {status}): {text}",
+            status_code=status,
+            details={"status_code": status},
+        )
 
     def __repr__(self) -> str:
         return (
-            f"<IaJsonClient site={self._site.name!r} "
+            f"<IaJsonClient site={self.site.name!r} "
             f"base_url={self._base_url!r} "
             f"endpoints={len(self._endpoints)}>"
         )
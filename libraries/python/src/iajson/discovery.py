@@ -7,13 +7,22 @@ Implements the discovery algorithm from the ia.json specification
 2. If not found (404), attempt ``https://{domain}/.well-known/ia.json``
 3. If not found, the site does not support ia.json
 
-Both synchronous and asynchronous variants are provided.
+Both synchronous and asynchronous variants are provided.  Successful
+results are cached in-process per domain for a short time (see
+``cache_ttl`` and :func:`clear_discovery_cache`).
 """
 
 from __future__ import annotations
 
+import asyncio
+import re
+import threading
+import time
+
 import httpx
 
+from iajson import _json
+from iajson._http import HTTP2_AVAILABLE
 from iajson.exceptions import DiscoveryError
 
 #: Maximum accepted file size (1 MB as recommended by the spec).
@@ -25,6 +34,22 @@ _DISCOVERY_PATHS: tuple[str, ...] = (
     "/.well-known/ia.json",
 )
 
+#: Pool limits for the temporary client used when none is passed in.
+_LIMITS = httpx.Limits(max_keepalive_connections=32)
+
+#: Default number of seconds a discovered document is reused for.
+_CACHE_TTL: float = 300.0
+
+#: Discovered documents by domain, as ``(expires_at, body)`` pairs where
+#: ``expires_at`` is on the :func:`time.monotonic` clock.  The raw,
+#: already-validated response body is kept rather than the parsed dict so
+#: every caller gets its own document to own and modify.
+_DISCOVERY_CACHE: dict[str, tuple[float, bytes]] = {}
+_cache_lock = threading.Lock()
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+_NO_STORE_RE = re.compile(r"(?:^|,)\s*(?:no-store|no-cache)\b", re.IGNORECASE)
+
 
 def _validate_document(data: dict, *, domain: str) -> dict:
     """Run minimal structural validation on a parsed ia.json document.
@@ -70,140 +95,366 @@ def _validate_document(data: dict, *, domain: str) -> dict:
     return data
 
 
-def discover(domain: str, *, timeout: float = 15.0) -> dict:
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+
+def clear_discovery_cache(domain: str | None = None) -> None:
+    """Drop cached discovery results.
+
+    Args:
+        domain: Only forget this domain.  If ``None``, the whole cache
+            is cleared.
+    """
+    with _cache_lock:
+        if domain is None:
+            _DISCOVERY_CACHE.clear()
+        else:
+            _DISCOVERY_CACHE.pop(domain, None)
+
+
+def _cache_get(domain: str) -> dict | None:
+    """Return a freshly parsed copy of the cached document for *domain*,
+    if it has not expired."""
+    entry = _DISCOVERY_CACHE.get(domain)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        with _cache_lock:
+            # Only evict the entry we looked at, not a fresher one a
+            # concurrent caller may have stored since.
+            if _DISCOVERY_CACHE.get(domain) is entry:
+                del _DISCOVERY_CACHE[domain]
+        return None
+    return _json.loads(entry[1])
+
+
+def _cache_put(
+    domain: str, body: bytes, cache_ttl: float, cache_control: str | None,
+) -> None:
+    """Store the validated *body* for *domain*, honouring the response's
+    Cache-Control.
+
+    The document is kept for *cache_ttl* seconds, or for the response's
+    ``max-age`` if that is shorter.  ``no-store`` / ``no-cache`` responses
+    are not cached.
+    """
+    ttl = cache_ttl
+    if cache_control:
+        if _NO_STORE_RE.search(cache_control):
+            return
+        match = _MAX_AGE_RE.search(cache_control)
+        if match is not None:
+            ttl = min(ttl, float(match.group(1)))
+    if ttl <= 0:
+        return
+    with _cache_lock:
+        _DISCOVERY_CACHE[domain] = (time.monotonic() + ttl, body)
+
+
+# ---------------------------------------------------------------------------
+# Discovery
+# ---------------------------------------------------------------------------
+
+
+def discover(
+    domain: str,
+    *,
+    timeout: float = 15.0,
+    client: httpx.Client | None = None,
+    cache_ttl: float = _CACHE_TTL,
+) -> dict:
     """Fetch and parse the ia.json file for *domain* (synchronous).
 
     Args:
         domain: The bare domain name (e.g. ``"example.com"``).
         timeout: HTTP request timeout in seconds.
+        client: An optional ``httpx.Client`` to fetch with, so its
+            connection pool can be reused for later API calls.  It is
+            left open.  If ``None``, a temporary client is used.
+        cache_ttl: How many seconds to reuse a previously discovered
+            document for *domain* (capped by the response's
+            ``Cache-Control: max-age``).  ``0`` bypasses the cache.
 
     Returns:
-        The parsed ia.json document as a dictionary.
+        The parsed ia.json document as a dictionary, owned by the
+        caller (cache hits are parsed afresh).
 
     Raises:
         DiscoveryError: If the ia.json file cannot be found or is
             invalid.
     """
-    last_error: Exception | None = None
+    if cache_ttl > 0:
+        cached = _cache_get(domain)
+        if cached is not None:
+            return cached
+
+    if client is None:
+        with _temporary_client(timeout) as tmp:
+            data, body, cache_control = _discover(tmp, domain, timeout)
+    else:
+        data, body, cache_control = _discover(client, domain, timeout)
+
+    if cache_ttl > 0:
+        _cache_put(domain, body, cache_ttl, cache_control)
+    return data
 
-    with httpx.Client(timeout=timeout, follow_redirects=True) as client:
-        for path in _DISCOVERY_PATHS:
-            url = f"https://{domain}{path}"
-            try:
-                response = client.get(url)
-            except httpx.HTTPError as exc:
-                last_error = exc
-                continue
 
-            if response.status_code == 404:
-                continue
+async def adiscover(
+    domain: str,
+    *,
+    timeout: float = 15.0,
+    client: httpx.AsyncClient | None = None,
+    cache_ttl: float = _CACHE_TTL,
+) -> dict:
+    """Fetch and parse the ia.json file for *domain* (asynchronous).
 
-            if response.status_code >= 400:
-                raise DiscoveryError(
-                    f"Failed to fetch {url}: HTTP {response.status_code}",
-                    domain=domain,
-                    status_code=response.status_code,
-                )
+    This is the ``async`` counterpart of :func:`discover`.  Both share
+    the same cache.
 
-            if len(response.content) > MAX_FILE_SIZE:
-                raise DiscoveryError(
-                    f"ia.json from {domain} exceeds maximum file size "
-                    f"({len(response.content)} bytes > {MAX_FILE_SIZE})",
-                    domain=domain,
-                )
+    Args:
+        domain: The bare domain name (e.g. ``"example.com"``).
+        timeout: HTTP request timeout in seconds.
+        client: An optional ``httpx.AsyncClient`` to fetch with.  It is
+            left open.  If ``None``, a temporary client is used.
+        cache_ttl: How many seconds to reuse a previously discovered
+            document for *domain*.  ``0`` bypasses the cache.
 
-            try:
-                data = response.json()
-            except ValueError as exc:
-                raise DiscoveryError(
-                    f"ia.json from {domain} is not valid JSON: {exc}",
-                    domain=domain,
-                ) from exc
+    Returns:
+        The parsed ia.json document as a dictionary, owned by the
+        caller (cache hits are parsed afresh).
+
+    Raises:
+        DiscoveryError: If the ia.json file cannot be found or is
+            invalid.
+    """
+    if cache_ttl > 0:
+        cached = _cache_get(domain)
+        if cached is not None:
+            return cached
+
+    if client is None:
+        async with _temporary_async_client(timeout) as tmp:
+            data, body, cache_control = await _adiscover(tmp, domain, timeout)
+    else:
+        data, body, cache_control = await _adiscover(client, domain, timeout)
+
+    if cache_ttl > 0:
+        _cache_put(domain, body, cache_ttl, cache_control)
+    return data
 
-            return _validate_document(data, domain=domain)
 
-    # Neither path returned a usable document.
-    if last_error is not None:
-        raise DiscoveryError(
-            f"Failed to discover ia.json for {domain}: {last_error}",
-            domain=domain,
-        ) from last_error
+def _temporary_client(timeout: float) -> httpx.Client:
+    """Build the client used by :func:`discover` when none is given.
 
-    raise DiscoveryError(
-        f"No ia.json file found for {domain}",
-        domain=domain,
-        status_code=404,
+    HTTP/2 is enabled when ``h2`` is installed, so the probes can share
+    one multiplexed connection.
+    """
+    return httpx.Client(
+        timeout=timeout,
+        follow_redirects=True,
+        limits=_LIMITS,
+        http2=HTTP2_AVAILABLE,
     )
 
 
-async def adiscover(domain: str, *, timeout: float = 15.0) -> dict:
-    """Fetch and parse the ia.json file for *domain* (asynchronous).
+def _temporary_async_client(timeout: float) -> httpx.AsyncClient:
+    """Async counterpart of :func:`_temporary_client`."""
+    return httpx.AsyncClient(
+        timeout=timeout,
+        follow_redirects=True,
+        limits=_LIMITS,
+        http2=HTTP2_AVAILABLE,
+    )
 
-    This is the ``async`` counterpart of :func:`discover`.
 
-    Args:
-        domain: The bare domain name (e.g. ``"example.com"``).
-        timeout: HTTP request timeout in seconds.
+#: A probe's outcome: the validated document (``None`` on 404), the raw
+#: body it was parsed from, and the response's ``Cache-Control`` header.
+_Probe = tuple[dict | None, bytes, str | None]
+
+
+def _check_response(response: httpx.Response, url: str, domain: str) -> bool:
+    """Check a probe's status line and headers before reading its body.
 
     Returns:
-        The parsed ia.json document as a dictionary.
+        ``False`` if *url* returned 404, ``True`` if the body should be
+        read.
 
     Raises:
-        DiscoveryError: If the ia.json file cannot be found or is
-            invalid.
+        DiscoveryError: If the response is an error other than 404 or
+            declares a body larger than :data:`MAX_FILE_SIZE`.
     """
-    last_error: Exception | None = None
+    if response.status_code == 404:
+        return False
 
-    async with httpx.AsyncClient(timeout=timeout, follow_redirects=True) as client:
-        for path in _DISCOVERY_PATHS:
-            url = f"https://{domain}{path}"
-            try:
-                response = await client.get(url)
-            except httpx.HTTPError as exc:
-                last_error = exc
-                continue
+    if response.status_code >= 400:
+        raise DiscoveryError(
+            f"Failed to fetch {url}: HTTP {response.status_code}",
+            domain=domain,
+            status_code=response.status_code,
+        )
 
-            if response.status_code == 404:
-                continue
+    content_length = response.headers.get("content-length")
+    if content_length is not None and content_length.isdigit():
+        size = int(content_length)
+        if size > MAX_FILE_SIZE:
+            raise DiscoveryError(
+                f"ia.json from {domain} exceeds maximum file size "
+                f"({size} bytes > {MAX_FILE_SIZE})",
+                domain=domain,
+            )
 
-            if response.status_code >= 400:
-                raise DiscoveryError(
-                    f"Failed to fetch {url}: HTTP {response.status_code}",
-                    domain=domain,
-                    status_code=response.status_code,
-                )
+    return True
 
-            if len(response.content) > MAX_FILE_SIZE:
-                raise DiscoveryError(
-                    f"ia.json from {domain} exceeds maximum file size "
-                    f"({len(response.content)} bytes > {MAX_FILE_SIZE})",
-                    domain=domain,
-                )
 
-            try:
-                data = response.json()
-            except ValueError as exc:
-                raise DiscoveryError(
-                    f"ia.json from {domain} is not valid JSON: {exc}",
-                    domain=domain,
-                ) from exc
+def _append_chunk(buffer: bytearray, chunk: bytes, domain: str) -> None:
+    """Append *chunk* to *buffer*, refusing to grow past the size limit."""
+    buffer += chunk
+    if len(buffer) > MAX_FILE_SIZE:
+        raise DiscoveryError(
+            f"ia.json from {domain} exceeds maximum file size "
+            f"(more than {MAX_FILE_SIZE} bytes)",
+            domain=domain,
+        )
 
-            return _validate_document(data, domain=domain)
 
-    if last_error is not None:
+def _parse_body(body: bytes | bytearray, domain: str) -> dict:
+    """Decode and validate a probe's body."""
+    try:
+        data = _json.loads(body)
+    except ValueError as exc:
         raise DiscoveryError(
+            f"ia.json from {domain} is not valid JSON: {exc}",
+            domain=domain,
+        ) from exc
+
+    return _validate_document(data, domain=domain)
+
+
+def _probe(client: httpx.Client, url: str, domain: str, timeout: float) -> _Probe:
+    """Fetch one discovery URL.
+
+    The body is streamed so an oversized response is abandoned as soon
+    as it passes :data:`MAX_FILE_SIZE` rather than buffered in full.
+    """
+    with client.stream(
+        "GET", url, timeout=timeout, follow_redirects=True,
+    ) as response:
+        if not _check_response(response, url, domain):
+            return None, b"", None
+        buffer = bytearray()
+        for chunk in response.iter_bytes():
+            _append_chunk(buffer, chunk, domain)
+        cache_control = response.headers.get("cache-control")
+    body = bytes(buffer)
+    return _parse_body(body, domain), body, cache_control
+
+
+async def _aprobe(
+    client: httpx.AsyncClient, url: str, domain: str, timeout: float,
+) -> _Probe:
+    """Async counterpart of :func:`_probe`."""
+    async with client.stream(
+        "GET", url, timeout=timeout, follow_redirects=True,
+    ) as response:
+        if not _check_response(response, url, domain):
+            return None, b"", None
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes():
+            _append_chunk(buffer, chunk, domain)
+        cache_control = response.headers.get("cache-control")
+    body = bytes(buffer)
+    return _parse_body(body, domain), body, cache_control
+
+
+def _not_found(domain: str, last_error: Exception | None) -> DiscoveryError:
+    """Build the error raised when no probe returned a usable document."""
+    if last_error is not None:
+        error = DiscoveryError(
             f"Failed to discover ia.json for {domain}: {last_error}",
             domain=domain,
-        ) from last_error
+        )
+        error.__cause__ = last_error
+        return error
 
-    raise DiscoveryError(
+    return DiscoveryError(
         f"No ia.json file found for {domain}",
         domain=domain,
         status_code=404,
     )
 
 
+def _discover(
+    client: httpx.Client, domain: str, timeout: float,
+) -> tuple[dict, bytes, str | None]:
+    """Run the discovery algorithm for *domain* using *client*.
+
+    Returns:
+        The validated document, the raw body it was parsed from, and the
+        response's ``Cache-Control`` header, if any.
+    """
+    last_error: Exception | None = None
+
+    for path in _DISCOVERY_PATHS:
+        try:
+            data, body, cache_control = _probe(
+                client, f"https://{domain}{path}", domain, timeout,
+            )
+        except httpx.HTTPError as exc:
+            last_error = exc
+            continue
+
+        if data is not None:
+            return data, body, cache_control
+
+    # Neither path returned a usable document.
+    raise _not_found(domain, last_error)
+
+
+async def _adiscover(
+    client: httpx.AsyncClient, domain: str, timeout: float,
+) -> tuple[dict, bytes, str | None]:
+    """Async counterpart of :func:`_discover`.
+
+    All paths are requested concurrently, so a site that only serves
+    ``/.well-known/ia.json`` costs one round trip instead of two.  The
+    responses are still consumed in priority order: a later path is only
+    used once every earlier one has 404'd or failed, and any probes still
+    in flight are cancelled as soon as the outcome is known.
+    """
+    tasks = [
+        asyncio.ensure_future(
+            _aprobe(client, f"https://{domain}{path}", domain, timeout),
+        )
+        for path in _DISCOVERY_PATHS
+    ]
+    last_error: Exception | None = None
+
+    try:
+        for task in tasks:
+            try:
+                data, body, cache_control = await task
+            except httpx.HTTPError as exc:
+                last_error = exc
+                continue
+
+            if data is not None:
+                return data, body, cache_control
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # Mark lower-priority failures as retrieved so asyncio
+                # does not log them when the task is collected.
+                task.exception()
+
+    raise _not_found(domain, last_error)
+
+
 __all__ = [
     "discover",
     "adiscover",
+    "clear_discovery_cache",
 ]
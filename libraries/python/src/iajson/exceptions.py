@@ -2,14 +2,182 @@
 
 from __future__ import annotations
 
+import functools
+import math
+import random
+import sys
+import time
+from collections.abc import Mapping
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from iajson import _json
+
+if TYPE_CHECKING:
+    import httpx
+
+_E = TypeVar("_E", bound="IaJsonError")
+
+#: Shared, read-only ``details`` for errors raised without any, so the
+#: common case does not allocate a fresh dict per exception.  Callers
+#: building errors themselves can pass it instead of a ``{}`` literal.
+EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
+
+_UTC = timezone.utc
+
+#: HTTP statuses worth retrying: timeouts, throttling and transient
+#: server-side failures.
+_RETRYABLE_STATUSES: frozenset[int] = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+#: Longest message whose envelope is cached.  Client errors embed the
+#: response body in the message, and those must not be kept alive by
+#: the cache.
+_CACHED_MESSAGE_MAX: int = 256
+
+
+@functools.lru_cache(maxsize=128)
+def _empty_envelope(code: str, message: str) -> bytes:
+    """Serialized envelope for an error without details.
+
+    Repeated errors (e.g. a burst of 429s) share the same code and
+    message, so the encoded bytes are reused.  Only called for messages
+    of at most :data:`_CACHED_MESSAGE_MAX` characters.
+    """
+    return _json.dumps(
+        {"ok": False, "code": code, "message": message, "details": {}}
+    )
+
 
 class IaJsonError(Exception):
-    """Base exception for all iajson errors."""
+    """Base exception for all iajson errors.
+
+    ``details`` may be a shared read-only mapping; do not mutate it in
+    place.  Use :meth:`with_details` to add entries.
+
+    ``status_code`` is the HTTP status behind the error, if any, and
+    :attr:`is_retryable` classifies it once at construction.
 
-    def __init__(self, message: str, *, details: dict | None = None) -> None:
+    The exception classes declare ``__slots__`` for their attributes.
+    ``BaseException`` still provides a ``__dict__``, but it is only
+    allocated if something stores an undeclared attribute.
+    """
+
+    __slots__ = ("message", "details", "status_code", "_retryable")
+
+    #: Subclass slot attributes carried through pickling, in order.
+    _STATE_FIELDS: tuple[str, ...] = ()
+
+    #: Stable machine-readable code used by :meth:`to_envelope`.
+    _CODE: str = "agent.error"
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        status_code: int | None = None,
+        details: Mapping[str, Any] | None = None,
+    ) -> None:
         super().__init__(message)
         self.message = message
-        self.details = details or {}
+        self.details = details if details is not None else EMPTY_DETAILS
+        self.status_code = status_code
+        self._retryable = status_code in _RETRYABLE_STATUSES
+
+    @property
+    def is_retryable(self) -> bool:
+        """Whether the request that failed is worth retrying.
+
+        True for rate limiting and for transient HTTP statuses (408,
+        425, 429, 500, 502, 503, 504).
+        """
+        return self._retryable
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Slot attributes are not part of BaseException's default pickle
+        # state (its __dict__), so they are emitted as a fixed-shape
+        # tuple: (message, details, status_code, retryable, subclass
+        # fields, extra attributes).
+        # Read-only mappings cannot be pickled; the shared empty one is
+        # sent as None and restored by _restore_error.
+        details = self.details
+        state_details: Mapping[str, Any] | None = details
+        if details is EMPTY_DETAILS:
+            state_details = None
+        elif isinstance(details, MappingProxyType):
+            state_details = dict(details)
+        fields = tuple([getattr(self, name) for name in self._STATE_FIELDS])
+        return (
+            _restore_error,
+            (
+                type(self),
+                self.args,
+                (
+                    self.message,
+                    state_details,
+                    self.status_code,
+                    self._retryable,
+                    fields,
+                    self.__dict__ or None,
+                ),
+            ),
+        )
+
+    def to_envelope(self) -> bytes:
+        """Serialize this error as a JSON error envelope.
+
+        The envelope has the stable shape ``{"ok": false, "code": ...,
+        "message": ..., "details": {...}}``, where ``code`` identifies
+        the error class (e.g. ``"agent.rate_limited"``).
+
+        Returns:
+            The compact UTF-8 JSON encoding of the envelope.
+        """
+        details = self.details
+        if not details:
+            if len(self.message) <= _CACHED_MESSAGE_MAX:
+                return _empty_envelope(self._CODE, self.message)
+            details = {}
+        return _json.dumps({
+            "ok": False,
+            "code": self._CODE,
+            "message": self.message,
+            "details": details if type(details) is dict else dict(details),
+        })
+
+    def with_details(self: _E, **details: Any) -> _E:
+        """Add entries to :attr:`details` and return this exception.
+
+        The existing mapping is copied rather than modified, so a shared
+        (or caller-owned) mapping is never changed.
+        """
+        self.details = {**self.details, **details}
+        return self
+
+
+def _restore_error(
+    cls: type[_E], args: tuple[Any, ...], state: tuple[Any, ...],
+) -> _E:
+    """Rebuild an exception from :meth:`IaJsonError.__reduce__` output.
+
+    The instance is created without running ``__init__``, whose
+    signature differs per class, and its slots are filled from the
+    fixed-shape *state* tuple.
+    """
+    message, details, status_code, retryable, fields, extra = state
+    error = cls.__new__(cls, *args)
+    error.message = message
+    error.details = details if details is not None else EMPTY_DETAILS
+    error.status_code = status_code
+    error._retryable = retryable
+    for name, value in zip(cls._STATE_FIELDS, fields):
+        setattr(error, name, value)
+    if extra:
+        for name, value in extra.items():
+            setattr(error, name, value)
+    return error
 
 
 class DiscoveryError(IaJsonError):
@@ -20,17 +188,20 @@ class DiscoveryError(IaJsonError):
     validation problems.
     """
 
+    __slots__ = ("domain",)
+    _STATE_FIELDS = __slots__
+    _CODE = "agent.discovery_failed"
+
     def __init__(
         self,
         message: str,
         *,
         domain: str | None = None,
         status_code: int | None = None,
-        details: dict | None = None,
+        details: Mapping[str, Any] | None = None,
     ) -> None:
-        super().__init__(message, details=details)
+        super().__init__(message, status_code=status_code, details=details)
         self.domain = domain
-        self.status_code = status_code
 
 
 class AuthenticationError(IaJsonError):
@@ -40,17 +211,53 @@ class AuthenticationError(IaJsonError):
     OAuth2 token errors.
     """
 
+    __slots__ = ("error_code",)
+    _STATE_FIELDS = __slots__
+    _CODE = "agent.authentication_failed"
+
     def __init__(
         self,
         message: str,
         *,
         error_code: str | None = None,
         status_code: int | None = None,
-        details: dict | None = None,
+        details: Mapping[str, Any] | None = None,
     ) -> None:
-        super().__init__(message, details=details)
+        super().__init__(message, status_code=status_code, details=details)
         self.error_code = error_code
-        self.status_code = status_code
+
+
+#: Default :class:`RateLimitError` message, shared by every default raise.
+_RATE_LIMIT_MSG: str = sys.intern("Rate limit exceeded")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_retry_after(value: str) -> tuple[bool, float] | None:
+    """Parse a ``Retry-After`` header value.
+
+    Bursts of 429 responses tend to repeat the same header, so results
+    are cached per raw value.  Because of the cache, HTTP-dates are
+    returned as an absolute time rather than a delay.
+
+    Returns:
+        ``(False, seconds)`` for a delay in seconds, ``(True, epoch)``
+        for an HTTP-date, or ``None`` if *value* is neither.
+    """
+    try:
+        seconds = float(value)
+    except ValueError:
+        pass
+    else:
+        return (False, seconds) if math.isfinite(seconds) else None
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        # RFC 5322 "-0000": treat as UTC.
+        return True, when.replace(tzinfo=_UTC).timestamp()
+    return True, when.timestamp()
 
 
 class RateLimitError(IaJsonError):
@@ -58,20 +265,66 @@ class RateLimitError(IaJsonError):
 
     The ``retry_after`` attribute contains the number of seconds to wait
     before retrying, if the server provided a ``Retry-After`` header.
+    ``status_code`` is always 429 and the error is always retryable.
     """
 
+    __slots__ = ("retry_after",)
+    _STATE_FIELDS = __slots__
+    _CODE = "agent.rate_limited"
+
     def __init__(
         self,
-        message: str = "Rate limit exceeded",
+        message: str = _RATE_LIMIT_MSG,
         *,
         retry_after: float | None = None,
-        details: dict | None = None,
+        details: Mapping[str, Any] | None = None,
     ) -> None:
-        super().__init__(message, details=details)
+        super().__init__(message, status_code=429, details=details)
         self.retry_after = retry_after
 
+    @classmethod
+    def from_response(
+        cls,
+        response: httpx.Response,
+        *,
+        message: str = _RATE_LIMIT_MSG,
+        default: float | None = 1.0,
+        jitter: float = 0.5,
+        details: Mapping[str, Any] | None = None,
+    ) -> RateLimitError:
+        """Build a :class:`RateLimitError` from a 429 response.
+
+        The ``Retry-After`` header may be a number of seconds or an
+        HTTP-date; both are turned into a delay in seconds.  The delay is
+        then stretched by a random factor of up to ``1 + jitter`` so
+        that clients throttled together do not all retry at once.
+
+        Args:
+            response: The rate-limited HTTP response.
+            message: The exception message.
+            default: The delay to use when the header is missing or
+                unparseable.  ``None`` leaves ``retry_after`` unset.
+            jitter: The maximum extra fraction of the delay to add.
+                ``0`` disables jitter.
+            details: Optional extra error details.
+
+        Returns:
+            The exception, ready to raise.
+        """
+        delay = default
+        raw = response.headers.get("Retry-After")
+        if raw is not None:
+            parsed = _parse_retry_after(raw.strip())
+            if parsed is not None:
+                is_date, value = parsed
+                delay = max(0.0, value - time.time() if is_date else value)
+        if delay is not None and jitter:
+            delay *= 1.0 + random.uniform(0.0, jitter)
+        return cls(message, retry_after=delay, details=details)
+
 
 __all__ = [
+    "EMPTY_DETAILS",
     "IaJsonError",
     "AuthenticationError",
     "DiscoveryError",
@@ -0,0 +1,292 @@
+"""Tests for :class:`iajson.client.IaJsonClient`."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from iajson import _json
+from iajson.auth.signer import verify_signature
+from iajson.client import (
+    _JSON_CT_HEADERS,
+    IaJsonClient,
+    _resolve_path,
+    _split_path,
+)
+from iajson.discovery import clear_discovery_cache
+from iajson.exceptions import AuthenticationError, IaJsonError, RateLimitError
+
+DOMAIN = "shop.example.com"
+BASE_URL = f"https://{DOMAIN}/api/v1"
+
+DOCUMENT = {
+    "version": "1.0.0",
+    "site": {"name": "Shop", "url": f"https://{DOMAIN}"},
+    "api": {
+        "base_url": BASE_URL,
+        "public": {
+            "list_products": {
+                "method": "GET",
+                "path": "/products",
+                "description": "List products",
+            },
+            "get_product": {
+                "method": "GET",
+                "path": "/products/{id}",
+                "description": "Get a product",
+                "parameters": {"id": {"type": "string", "required": True}},
+            },
+            "create_review": {
+                "method": "POST",
+                "path": "/products/{id}/reviews/{review_id}",
+                "description": "Review a product",
+            },
+        },
+        "protected": {
+            "update_stock": {
+                "method": "PUT",
+                "path": "/inventory/{sku}",
+                "description": "Set stock for a SKU",
+            },
+        },
+        "user_required": {
+            "place_order": {
+                "method": "POST",
+                "path": "/orders",
+                "description": "Place an order",
+            },
+        },
+    },
+}
+
+
+@pytest.fixture(autouse=True)
+def _empty_discovery_cache():
+    clear_discovery_cache()
+    yield
+    clear_discovery_cache()
+
+
+# -----------------------------------------------------------------------
+# Connection pool
+# -----------------------------------------------------------------------
+
+def test_pool_does_not_replay_cookies() -> None:
+    cookie = {"Set-Cookie": "sess=site; Path=/"}
+    with respx.mock:
+        respx.get(f"https://{DOMAIN}/ia.json").mock(
+            return_value=httpx.Response(200, json=DOCUMENT, headers=cookie),
+        )
+        products = respx.get(f"{BASE_URL}/products").mock(
+            return_value=httpx.Response(200, json=[], headers=cookie),
+        )
+        with IaJsonClient.discover(DOMAIN) as client:
+            client.call("list_products")
+            client.call("list_products")
+
+    assert [call.request.headers.get("cookie") for call in products.calls] == [None, None]
+
+
+@pytest.mark.asyncio
+async def test_async_pool_does_not_replay_cookies() -> None:
+    cookie = {"Set-Cookie": "sess=site; Path=/"}
+    with respx.mock:
+        respx.get(f"https://{DOMAIN}/ia.json").mock(
+            return_value=httpx.Response(200, json=DOCUMENT, headers=cookie),
+        )
+        respx.get(f"https://{DOMAIN}/.well-known/ia.json").mock(
+            return_value=httpx.Response(404),
+        )
+        products = respx.get(f"{BASE_URL}/products").mock(
+            return_value=httpx.Response(200, json=[], headers=cookie),
+        )
+        async with await IaJsonClient.adiscover(DOMAIN) as client:
+            await client.acall("list_products")
+            await client.acall("list_products")
+
+    assert [call.request.headers.get("cookie") for call in products.calls] == [None, None]
+
+
+# -----------------------------------------------------------------------
+# Path parameters
+# -----------------------------------------------------------------------
+
+@pytest.mark.parametrize("path, split", [
+    ("/products", (("/products",), ())),
+    ("/products/{id}", (("/products/", ""), ("id",))),
+    ("{tenant}/items", (("", "/items"), ("tenant",))),
+    ("/a/{x}{y}/b", (("/a/", "", "/b"), ("x", "y"))),
+    ("/a/{not-a-name}", (("/a/{not-a-name}",), ())),
+])
+def test_split_path(path: str, split: tuple) -> None:
+    assert _split_path(path) == split
+
+
+def test_resolve_path_pops_consumed_params() -> None:
+    params = {"id": 7, "review_id": "r 1", "stars": 5}
+    resolved = _resolve_path(_split_path("/p/{id}/r/{review_id}"), params)
+    assert resolved == "/p/7/r/r 1"
+    assert params == {"stars": 5}
+
+
+def test_resolve_path_keeps_missing_placeholders() -> None:
+    params = {"id": 7}
+    assert _resolve_path(_split_path("/p/{id}/r/{review_id}"), params) == "/p/7/r/{review_id}"
+    assert params == {}
+
+
+def test_has_path_params() -> None:
+    client = IaJsonClient(DOCUMENT)
+    assert not client.get_endpoint("list_products").has_path_params
+    assert client.get_endpoint("get_product").has_path_params
+    assert client.get_endpoint("create_review").has_path_params
+
+
+def test_call_resolves_path_and_sends_the_rest() -> None:
+    with respx.mock:
+        product = respx.get(f"{BASE_URL}/products/42").mock(
+            return_value=httpx.Response(200, json={"id": "42"}),
+        )
+        review = respx.post(f"{BASE_URL}/products/42/reviews/9").mock(
+            return_value=httpx.Response(201, json={}),
+        )
+        products = respx.get(f"{BASE_URL}/products").mock(
+            return_value=httpx.Response(200, json=[]),
+        )
+        with IaJsonClient(DOCUMENT) as client:
+            assert client.call("get_product", id=42, lang="en") == {"id": "42"}
+            client.call("create_review", id="42", review_id=9, stars=5)
+            client.call("list_products", page=2)
+
+    assert dict(product.calls.last.request.url.params) == {"lang": "en"}
+    assert _json.loads(review.calls.last.request.content) == {"stars": 5}
+    assert dict(products.calls.last.request.url.params) == {"page": "2"}
+
+
+# -----------------------------------------------------------------------
+# Request headers
+# -----------------------------------------------------------------------
+
+def _signature_ok(request: httpx.Request) -> bool:
+    return verify_signature(
+        "secret",
+        int(request.headers["X-IA-Timestamp"]),
+        request.content,
+        request.headers["X-IA-Signature"],
+    )
+
+
+def test_body_request_headers() -> None:
+    with respx.mock:
+        review = respx.post(f"{BASE_URL}/products/1/reviews/2").mock(
+            return_value=httpx.Response(201, json={}),
+        )
+        stock = respx.put(f"{BASE_URL}/inventory/sku-1").mock(
+            return_value=httpx.Response(200, json={}),
+        )
+        order = respx.post(f"{BASE_URL}/orders").mock(
+            return_value=httpx.Response(201, json={}),
+        )
+        with IaJsonClient(
+            DOCUMENT, api_key="key", secret="secret", access_token="token",
+        ) as client:
+            client.call("create_review", id=1, review_id=2, stars=5)
+            client.call("update_stock", sku="sku-1", count=3)
+            client.call("place_order", items=["sku-1"])
+
+    public = review.calls.last.request
+    assert public.headers["content-type"] == "application/json"
+    assert "x-ia-signature" not in public.headers
+
+    protected = stock.calls.last.request
+    assert protected.headers["content-type"] == "application/json"
+    assert protected.headers["x-ia-key"] == "key"
+    assert _signature_ok(protected)
+
+    user = order.calls.last.request
+    assert user.headers["content-type"] == "application/json"
+    assert user.headers["authorization"] == "Bearer token"
+    assert _signature_ok(user)
+
+    assert dict(_JSON_CT_HEADERS) == {"Content-Type": "application/json"}
+
+
+def test_request_without_body_sends_no_content_type() -> None:
+    with respx.mock:
+        products = respx.get(f"{BASE_URL}/products").mock(
+            return_value=httpx.Response(200, json=[]),
+        )
+        with IaJsonClient(DOCUMENT) as client:
+            client.call("list_products")
+
+    assert "content-type" not in products.calls.last.request.headers
+
+
+@pytest.mark.asyncio
+async def test_async_body_request_headers() -> None:
+    with respx.mock:
+        order = respx.post(f"{BASE_URL}/orders").mock(
+            return_value=httpx.Response(201, json={"id": "o1"}),
+        )
+        async with IaJsonClient(
+            DOCUMENT, api_key="key", secret="secret",
+        ) as client:
+            assert await client.acall(
+                "place_order", access_token="per-call", items=[],
+            ) == {"id": "o1"}
+
+    request = order.calls.last.request
+    assert request.headers["content-type"] == "application/json"
+    assert request.headers["authorization"] == "Bearer per-call"
+    assert _signature_ok(request)
+
+
+# -----------------------------------------------------------------------
+# Error responses
+# -----------------------------------------------------------------------
+
+def _call_with_response(response: httpx.Response) -> dict:
+    with respx.mock:
+        respx.get(f"{BASE_URL}/products").mock(return_value=response)
+        with IaJsonClient(DOCUMENT) as client:
+            return client.call("list_products")
+
+
+@pytest.mark.parametrize("charset, text", [
+    ("iso-8859-1", "Café indisponible"),
+    ("utf-8", "Café indisponible ✓"),
+    ("shift_jis", "サービス停止中"),
+])
+def test_error_message_honours_declared_charset(charset: str, text: str) -> None:
+    response = httpx.Response(
+        503,
+        content=text.encode(charset),
+        headers={"Content-Type": f"text/plain; charset={charset}"},
+    )
+    with pytest.raises(IaJsonError) as excinfo:
+        _call_with_response(response)
+    assert excinfo.value.message == f"API error (HTTP 503): {text}"
+    assert excinfo.value.status_code == 503
+
+
+def test_error_message_defaults_to_utf8() -> None:
+    response = httpx.Response(500, content="naïve".encode())
+    with pytest.raises(IaJsonError, match="naïve"):
+        _call_with_response(response)
+
+
+def test_authentication_error_carries_error_code() -> None:
+    response = httpx.Response(401, json={"error": {"code": "bad_signature"}})
+    with pytest.raises(AuthenticationError) as excinfo:
+        _call_with_response(response)
+    assert excinfo.value.error_code == "bad_signature"
+    assert excinfo.value.status_code == 401
+
+
+def test_rate_limit_error_reports_retry_after() -> None:
+    response = httpx.Response(429, text="slow down", headers={"Retry-After": "7"})
+    with pytest.raises(RateLimitError) as excinfo:
+        _call_with_response(response)
+    assert excinfo.value.retry_after == 7.0
+    assert excinfo.value.message == "Rate limit exceeded: slow down"
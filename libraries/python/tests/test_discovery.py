@@ -0,0 +1,338 @@
+"""Tests for ia.json discovery in :mod:`iajson.discovery`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+
+from iajson import _json
+from iajson.discovery import (
+    MAX_FILE_SIZE,
+    adiscover,
+    clear_discovery_cache,
+    discover,
+)
+from iajson.exceptions import DiscoveryError
+
+DOMAIN = "example.com"
+ROOT = f"https://{DOMAIN}/ia.json"
+WELL_KNOWN = f"https://{DOMAIN}/.well-known/ia.json"
+
+
+def _document(name: str) -> dict:
+    return {
+        "version": "1.0.0",
+        "site": {"name": name, "type": "other"},
+        "api": {"base_url": f"https://{DOMAIN}/api"},
+    }
+
+
+@pytest.fixture(autouse=True)
+def _empty_discovery_cache():
+    clear_discovery_cache()
+    yield
+    clear_discovery_cache()
+
+
+# -----------------------------------------------------------------------
+# Concurrent probes (adiscover)
+# -----------------------------------------------------------------------
+
+_Handler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+def _async_client(routes: dict[str, _Handler]) -> httpx.AsyncClient:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return await routes[str(request.url)](request)
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _respond(response: httpx.Response, delay: float = 0.0) -> _Handler:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(delay)
+        return response
+
+    return handler
+
+
+def _hang(cancelled: asyncio.Event) -> _Handler:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        raise AssertionError("probe was not cancelled")
+
+    return handler
+
+
+async def _adiscover(routes: dict[str, _Handler]) -> dict:
+    async with _async_client(routes) as client:
+        return await asyncio.wait_for(
+            adiscover(DOMAIN, client=client, cache_ttl=0), timeout=5,
+        )
+
+
+@pytest.mark.asyncio
+async def test_adiscover_prefers_root_even_if_well_known_answers_first() -> None:
+    data = await _adiscover({
+        ROOT: _respond(httpx.Response(200, json=_document("root")), delay=0.05),
+        WELL_KNOWN: _respond(httpx.Response(200, json=_document("well-known"))),
+    })
+    assert data["site"]["name"] == "root"
+
+
+@pytest.mark.asyncio
+async def test_adiscover_falls_back_after_root_404() -> None:
+    data = await _adiscover({
+        ROOT: _respond(httpx.Response(404), delay=0.05),
+        WELL_KNOWN: _respond(httpx.Response(200, json=_document("well-known"))),
+    })
+    assert data["site"]["name"] == "well-known"
+
+
+@pytest.mark.asyncio
+async def test_adiscover_falls_back_after_root_transport_error() -> None:
+    async def fail(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    data = await _adiscover({
+        ROOT: fail,
+        WELL_KNOWN: _respond(httpx.Response(200, json=_document("well-known"))),
+    })
+    assert data["site"]["name"] == "well-known"
+
+
+@pytest.mark.asyncio
+async def test_adiscover_cancels_lower_priority_probe_on_success() -> None:
+    cancelled = asyncio.Event()
+    data = await _adiscover({
+        ROOT: _respond(httpx.Response(200, json=_document("root"))),
+        WELL_KNOWN: _hang(cancelled),
+    })
+    assert data["site"]["name"] == "root"
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_adiscover_cancels_lower_priority_probe_on_error() -> None:
+    cancelled = asyncio.Event()
+    with pytest.raises(DiscoveryError) as excinfo:
+        await _adiscover({
+            ROOT: _respond(httpx.Response(500)),
+            WELL_KNOWN: _hang(cancelled),
+        })
+    assert excinfo.value.status_code == 500
+    await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_adiscover_not_found() -> None:
+    with pytest.raises(DiscoveryError) as excinfo:
+        await _adiscover({
+            ROOT: _respond(httpx.Response(404)),
+            WELL_KNOWN: _respond(httpx.Response(404)),
+        })
+    assert excinfo.value.status_code == 404
+
+
+# -----------------------------------------------------------------------
+# Result cache
+# -----------------------------------------------------------------------
+
+class _Site:
+    """A mock site serving one ia.json document at the root path."""
+
+    def __init__(self, headers: dict[str, str] | None = None) -> None:
+        self.headers = headers or {}
+        self.hits = 0
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if str(request.url) != ROOT:
+            return httpx.Response(404)
+        self.hits += 1
+        return httpx.Response(
+            200,
+            content=_json.dumps(_document(f"v{self.hits}")),
+            headers=self.headers,
+        )
+
+    def discover(self, **kwargs) -> dict:
+        with httpx.Client(transport=httpx.MockTransport(self.handler)) as client:
+            return discover(DOMAIN, client=client, **kwargs)
+
+
+class _Clock:
+    """Stand-in for :func:`time.monotonic` that only moves when told."""
+
+    def __init__(self) -> None:
+        self.now = time.monotonic()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr("iajson.discovery.time.monotonic", clock)
+    return clock
+
+
+def test_cache_hit_skips_the_network_and_returns_a_private_copy() -> None:
+    site = _Site()
+    first = site.discover()
+    first["site"]["name"] = "mutated"
+    second = site.discover()
+
+    assert site.hits == 1
+    assert second["site"]["name"] == "v1"
+    assert second is not first
+
+
+def test_cache_expires_after_ttl(clock: _Clock) -> None:
+    site = _Site()
+    site.discover(cache_ttl=10)
+    clock.now += 9
+    site.discover(cache_ttl=10)
+    assert site.hits == 1
+    clock.now += 2
+    assert site.discover(cache_ttl=10)["site"]["name"] == "v2"
+
+
+def test_max_age_caps_the_ttl(clock: _Clock) -> None:
+    site = _Site({"Cache-Control": "public, max-age=5"})
+    site.discover(cache_ttl=300)
+    clock.now += 4
+    site.discover(cache_ttl=300)
+    assert site.hits == 1
+    clock.now += 2
+    site.discover(cache_ttl=300)
+    assert site.hits == 2
+
+
+def test_longer_max_age_does_not_extend_the_ttl(clock: _Clock) -> None:
+    site = _Site({"Cache-Control": "max-age=3600"})
+    site.discover(cache_ttl=10)
+    clock.now += 11
+    site.discover(cache_ttl=10)
+    assert site.hits == 2
+
+
+@pytest.mark.parametrize("cache_control", [
+    "no-store", "no-cache", "private, no-store", "NO-CACHE", "max-age=0",
+])
+def test_uncacheable_responses_are_not_stored(cache_control: str) -> None:
+    site = _Site({"Cache-Control": cache_control})
+    site.discover()
+    site.discover()
+    assert site.hits == 2
+
+
+def test_zero_ttl_bypasses_the_cache() -> None:
+    site = _Site()
+    site.discover()
+    site.discover(cache_ttl=0)
+    assert site.hits == 2
+
+
+def test_clear_discovery_cache_for_one_domain() -> None:
+    site = _Site()
+    site.discover()
+    clear_discovery_cache("other.example.com")
+    site.discover()
+    assert site.hits == 1
+    clear_discovery_cache(DOMAIN)
+    site.discover()
+    assert site.hits == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_and_async_share_the_cache() -> None:
+    site = _Site()
+    site.discover()
+
+    async def unreachable(request: httpx.Request) -> httpx.Response:
+        raise AssertionError("cache miss")
+
+    async with _async_client({ROOT: unreachable, WELL_KNOWN: unreachable}) as client:
+        data = await adiscover(DOMAIN, client=client)
+    assert data["site"]["name"] == "v1"
+
+
+# -----------------------------------------------------------------------
+# Size limit
+# -----------------------------------------------------------------------
+
+class _Stream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """A response body served in fixed-size chunks, recording how many
+    were read."""
+
+    def __init__(self, body: bytes, chunk_size: int = 64 * 1024) -> None:
+        self.chunks = [
+            body[i:i + chunk_size] for i in range(0, len(body), chunk_size)
+        ]
+        self.served = 0
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.served += 1
+            yield chunk
+
+    async def __aiter__(self):
+        for chunk in self:
+            yield chunk
+
+
+def _padded_document(size: int) -> bytes:
+    body = _json.dumps(_document("big"))
+    return body[:-1] + b" " * (size - len(body)) + b"}"
+
+
+def _discover_stream(stream: _Stream, headers: dict[str, str] | None = None) -> dict:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=stream, headers=headers)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        return discover(DOMAIN, client=client, cache_ttl=0)
+
+
+def test_body_at_the_limit_is_accepted() -> None:
+    stream = _Stream(_padded_document(MAX_FILE_SIZE))
+    assert _discover_stream(stream)["site"]["name"] == "big"
+
+
+def test_oversized_body_stops_reading_at_the_limit() -> None:
+    stream = _Stream(_padded_document(4 * MAX_FILE_SIZE))
+    with pytest.raises(DiscoveryError, match="exceeds maximum file size"):
+        _discover_stream(stream)
+    limit_chunks = MAX_FILE_SIZE // len(stream.chunks[0]) + 1
+    assert stream.served <= limit_chunks < len(stream.chunks)
+
+
+def test_oversized_content_length_is_rejected_before_reading() -> None:
+    stream = _Stream(_json.dumps(_document("small")))
+    with pytest.raises(DiscoveryError, match="exceeds maximum file size"):
+        _discover_stream(stream, {"Content-Length": str(MAX_FILE_SIZE + 1)})
+    assert stream.served == 0
+
+
+@pytest.mark.asyncio
+async def test_adiscover_oversized_body_stops_reading_at_the_limit() -> None:
+    stream = _Stream(_padded_document(4 * MAX_FILE_SIZE))
+
+    async def oversized(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, stream=stream)
+
+    with pytest.raises(DiscoveryError, match="exceeds maximum file size"):
+        await _adiscover({
+            ROOT: oversized,
+            WELL_KNOWN: _respond(httpx.Response(404)),
+        })
+    assert stream.served < len(stream.chunks)
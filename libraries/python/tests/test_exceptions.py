@@ -0,0 +1,207 @@
+"""Tests for :mod:`iajson.exceptions`."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+import time
+from email.utils import formatdate
+from types import MappingProxyType
+
+import httpx
+import pytest
+
+from iajson import _json
+from iajson.exceptions import (
+    _CACHED_MESSAGE_MAX,
+    EMPTY_DETAILS,
+    AuthenticationError,
+    DiscoveryError,
+    IaJsonError,
+    RateLimitError,
+    _empty_envelope,
+)
+
+ERRORS = [
+    IaJsonError("plain"),
+    IaJsonError("server", status_code=503, details={"status_code": 503}),
+    DiscoveryError("missing", domain="example.com", status_code=404),
+    AuthenticationError("denied", error_code="bad_signature", status_code=401),
+    RateLimitError(retry_after=2.5),
+    RateLimitError("slow down", details=MappingProxyType({"limit": 10})),
+]
+
+#: Every attribute an iajson exception can carry.
+ATTRIBUTES = (
+    "args", "message", "details", "status_code", "is_retryable",
+    "domain", "error_code", "retry_after",
+)
+
+
+def _assert_same(restored: IaJsonError, error: IaJsonError) -> None:
+    assert type(restored) is type(error)
+    for name in ATTRIBUTES:
+        assert getattr(restored, name, None) == getattr(error, name, None), name
+
+
+# -----------------------------------------------------------------------
+# Slots
+# -----------------------------------------------------------------------
+
+@pytest.mark.parametrize("error", ERRORS)
+def test_slot_attributes_survive_copy(error: IaJsonError) -> None:
+    _assert_same(copy.copy(error), error)
+    _assert_same(copy.deepcopy(error), error)
+
+
+def test_undeclared_attributes_still_work_and_survive_copy() -> None:
+    error = DiscoveryError("missing", domain="example.com")
+    error.add_note("while probing /ia.json")
+    error.probe = "/ia.json"
+    restored = copy.copy(error)
+    assert restored.__notes__ == ["while probing /ia.json"]
+    assert restored.probe == "/ia.json"
+
+
+
+# -----------------------------------------------------------------------
+# Pickling
+# -----------------------------------------------------------------------
+
+@pytest.mark.parametrize("error", ERRORS)
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_pickle_round_trip(error: IaJsonError, protocol: int) -> None:
+    _assert_same(pickle.loads(pickle.dumps(error, protocol)), error)
+
+
+def test_pickle_restores_the_shared_empty_details() -> None:
+    for error in (IaJsonError("x"), RateLimitError()):
+        assert pickle.loads(pickle.dumps(error)).details is EMPTY_DETAILS
+
+
+def test_pickle_keeps_notes_and_undeclared_attributes() -> None:
+    error = AuthenticationError("denied", status_code=403)
+    error.add_note("token endpoint")
+    error.request_id = "req-1"
+    restored = pickle.loads(pickle.dumps(error))
+    assert restored.__notes__ == ["token endpoint"]
+    assert restored.request_id == "req-1"
+    assert restored.__dict__ == error.__dict__
+
+
+def test_pickle_state_has_a_fixed_shape() -> None:
+    for error in ERRORS:
+        _, (cls, _, state) = error.__reduce__()
+        assert cls is type(error)
+        assert len(state) == 6
+        assert len(state[4]) == len(cls._STATE_FIELDS)
+
+
+# -----------------------------------------------------------------------
+# RateLimitError.from_response
+# -----------------------------------------------------------------------
+
+def _rate_limited(retry_after: str | None = None) -> httpx.Response:
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return httpx.Response(429, headers=headers)
+
+
+@pytest.mark.parametrize("header, delay", [
+    ("3", 3.0),
+    (" 3 ", 3.0),
+    ("0.25", 0.25),
+    ("0", 0.0),
+    ("-5", 0.0),
+])
+def test_from_response_seconds(header: str, delay: float) -> None:
+    error = RateLimitError.from_response(_rate_limited(header), jitter=0.0)
+    assert error.retry_after == delay
+    assert error.status_code == 429
+    assert error.is_retryable
+
+
+def test_from_response_http_date() -> None:
+    header = formatdate(time.time() + 30, usegmt=True)
+    error = RateLimitError.from_response(_rate_limited(header), jitter=0.0)
+    assert 28.0 <= error.retry_after <= 30.0
+
+
+def test_from_response_http_date_counts_down(monkeypatch: pytest.MonkeyPatch) -> None:
+    # The parsed header is cached, so the delay must still be computed
+    # against the current time on every call.
+    now = time.time()
+    header = formatdate(now + 60, usegmt=True)
+    monkeypatch.setattr("iajson.exceptions.time.time", lambda: now)
+    first = RateLimitError.from_response(_rate_limited(header), jitter=0.0)
+    monkeypatch.setattr("iajson.exceptions.time.time", lambda: now + 45)
+    second = RateLimitError.from_response(_rate_limited(header), jitter=0.0)
+    assert first.retry_after - second.retry_after == pytest.approx(45.0)
+
+
+def test_from_response_past_date_is_zero() -> None:
+    header = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert RateLimitError.from_response(_rate_limited(header)).retry_after == 0.0
+
+
+@pytest.mark.parametrize("header", [None, "", "soon", "inf", "nan", "3 seconds"])
+def test_from_response_falls_back_to_default(header: str | None) -> None:
+    response = _rate_limited(header)
+    assert RateLimitError.from_response(response, jitter=0.0).retry_after == 1.0
+    assert RateLimitError.from_response(
+        response, default=4.0, jitter=0.0,
+    ).retry_after == 4.0
+    assert RateLimitError.from_response(response, default=None).retry_after is None
+
+
+def test_from_response_jitter_stays_in_bounds() -> None:
+    response = _rate_limited("10")
+    delays = [
+        RateLimitError.from_response(response, jitter=0.5).retry_after
+        for _ in range(200)
+    ]
+    assert all(10.0 <= delay <= 15.0 for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_from_response_passes_message_and_details() -> None:
+    error = RateLimitError.from_response(
+        _rate_limited("1"), message="slow down", details={"limit": 10},
+    )
+    assert error.message == "slow down"
+    assert error.details == {"limit": 10}
+
+
+# -----------------------------------------------------------------------
+# Envelopes
+# -----------------------------------------------------------------------
+
+@pytest.mark.parametrize("error, code", [
+    (IaJsonError("boom"), "agent.error"),
+    (DiscoveryError("gone", domain="example.com"), "agent.discovery_failed"),
+    (AuthenticationError("denied"), "agent.authentication_failed"),
+    (RateLimitError(), "agent.rate_limited"),
+])
+def test_envelope_shape(error: IaJsonError, code: str) -> None:
+    assert _json.loads(error.to_envelope()) == {
+        "ok": False, "code": code, "message": error.message, "details": {},
+    }
+
+
+def test_envelope_includes_details() -> None:
+    error = RateLimitError(details=MappingProxyType({"limit": 10}))
+    assert _json.loads(error.to_envelope())["details"] == {"limit": 10}
+    assert _json.loads(
+        error.with_details(window="1m").to_envelope(),
+    )["details"] == {"limit": 10, "window": "1m"}
+
+
+def test_envelope_cache_skips_long_messages() -> None:
+    _empty_envelope.cache_clear()
+    short = IaJsonError("x" * _CACHED_MESSAGE_MAX)
+    assert short.to_envelope() is short.to_envelope()
+    assert _empty_envelope.cache_info().currsize == 1
+
+    body = "x" * (_CACHED_MESSAGE_MAX + 1)
+    long = RateLimitError(f"Rate limit exceeded: {body}")
+    assert _json.loads(long.to_envelope())["message"] == long.message
+    assert _empty_envelope.cache_info().currsize == 1
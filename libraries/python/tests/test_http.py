@@ -0,0 +1,65 @@
+"""Tests for the shared clients in :mod:`iajson._http`."""
+
+from __future__ import annotations
+
+import httpx
+import pytest
+import respx
+
+from iajson import _http
+from iajson.auth.oauth import OAuth2Config, aexchange_code, exchange_code
+
+TOKEN_URL = "https://auth.example.com/token"
+CONFIG = OAuth2Config(
+    authorization_url="https://auth.example.com/authorize",
+    token_url=TOKEN_URL,
+    scopes={"read": "Read"},
+)
+TOKEN_BODY = {"access_token": "at", "token_type": "Bearer"}
+
+
+def _set_cookie_once(request: httpx.Request, calls: list[httpx.Request]) -> httpx.Response:
+    calls.append(request)
+    headers = {"Set-Cookie": "sess=tenantA; Path=/"} if len(calls) == 1 else {}
+    return httpx.Response(200, json=TOKEN_BODY, headers=headers)
+
+
+def _exchange_kwargs(client_id: str) -> dict[str, str]:
+    return {
+        "client_id": client_id,
+        "client_secret": "secret",
+        "code": "code",
+        "redirect_uri": "https://agent.example.com/cb",
+    }
+
+
+@pytest.fixture(autouse=True)
+def _fresh_shared_clients():
+    _http.close_shared_clients()
+    yield
+    _http.close_shared_clients()
+
+
+def test_shared_client_does_not_carry_cookies_between_calls() -> None:
+    calls: list[httpx.Request] = []
+    with respx.mock:
+        respx.post(TOKEN_URL).mock(side_effect=lambda r: _set_cookie_once(r, calls))
+        exchange_code(CONFIG, **_exchange_kwargs("tenant-a"))
+        exchange_code(CONFIG, **_exchange_kwargs("tenant-b"))
+
+    assert len(calls) == 2
+    assert "cookie" not in calls[1].headers
+    assert not _http.get_client().cookies
+
+
+@pytest.mark.asyncio
+async def test_shared_async_client_does_not_carry_cookies_between_calls() -> None:
+    calls: list[httpx.Request] = []
+    with respx.mock:
+        respx.post(TOKEN_URL).mock(side_effect=lambda r: _set_cookie_once(r, calls))
+        await aexchange_code(CONFIG, **_exchange_kwargs("tenant-a"))
+        await aexchange_code(CONFIG, **_exchange_kwargs("tenant-b"))
+    await _http.aclose_shared_clients()
+
+    assert len(calls) == 2
+    assert "cookie" not in calls[1].headers
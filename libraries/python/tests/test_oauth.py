@@ -0,0 +1,156 @@
+"""Tests for the OAuth2 helpers in :mod:`iajson.auth.oauth`."""
+
+from __future__ import annotations
+
+import random
+from urllib.parse import quote_plus, urlencode
+
+import pytest
+
+from iajson.auth.oauth import (
+    OAuth2Config,
+    PKCEChallenge,
+    _exchange_payload,
+    _form_quote,
+    _refresh_payload,
+    build_authorization_url,
+)
+
+#: Characters that exercise every branch of the form encoder: safe ASCII,
+#: space, reserved and percent-encoded ASCII, and multi-byte UTF-8.
+_ALPHABET = "aZ09_.-~ !*'()&=+/?#%\x00\né中\U0001f600"
+
+
+def _random_strings(count: int, seed: int) -> list[str]:
+    rnd = random.Random(seed)
+    return [
+        "".join(rnd.choice(_ALPHABET) for _ in range(rnd.randint(0, 24)))
+        for _ in range(count)
+    ]
+
+
+# -----------------------------------------------------------------------
+# Form encoding
+# -----------------------------------------------------------------------
+
+def test_form_quote_matches_quote_plus() -> None:
+    for value in _random_strings(2000, seed=1):
+        assert _form_quote(value) == quote_plus(value, safe="").encode("ascii")
+
+
+def test_exchange_payload_matches_urlencode() -> None:
+    values = _random_strings(500, seed=2)
+    for client_id, secret, code, redirect_uri, verifier in zip(*[iter(values)] * 5):
+        fields = {
+            "grant_type": "authorization_code",
+            "client_id": client_id,
+            "client_secret": secret,
+            "code": code,
+            "redirect_uri": redirect_uri,
+        }
+        assert _exchange_payload(
+            client_id, secret, code, redirect_uri, None,
+        ) == urlencode(fields).encode("ascii")
+        fields["code_verifier"] = verifier
+        assert _exchange_payload(
+            client_id, secret, code, redirect_uri, verifier,
+        ) == urlencode(fields).encode("ascii")
+
+
+def test_refresh_payload_matches_urlencode() -> None:
+    values = _random_strings(300, seed=3)
+    for client_id, secret, refresh in zip(*[iter(values)] * 3):
+        assert _refresh_payload(client_id, secret, refresh) == urlencode({
+            "grant_type": "refresh_token",
+            "client_id": client_id,
+            "client_secret": secret,
+            "refresh_token": refresh,
+        }).encode("ascii")
+
+
+# -----------------------------------------------------------------------
+# Authorization URL
+# -----------------------------------------------------------------------
+
+def _config(authorization_url: str) -> OAuth2Config:
+    return OAuth2Config(
+        authorization_url=authorization_url,
+        token_url="https://auth.example.com/token",
+        scopes={"read:orders": "Read orders", "write orders": "Write"},
+    )
+
+
+@pytest.mark.parametrize("authorization_url, separator", [
+    ("https://auth.example.com/authorize", "?"),
+    ("https://auth.example.com/authorize?tenant=1", "&"),
+])
+def test_authorization_url_separator(authorization_url: str, separator: str) -> None:
+    url = build_authorization_url(
+        _config(authorization_url),
+        client_id="client",
+        redirect_uri="https://agent.example.com/cb",
+    )
+    assert url.startswith(f"{authorization_url}{separator}response_type=code&")
+
+
+def test_authorization_url_prefix_tracks_every_argument() -> None:
+    base = {"client_id": "client", "redirect_uri": "https://agent.example.com/cb"}
+    config = _config("https://auth.example.com/authorize")
+    first = build_authorization_url(config, scopes=["a"], **base)
+    assert build_authorization_url(config, scopes=["a"], **base) == first
+    assert build_authorization_url(config, scopes=["b"], **base) != first
+    assert build_authorization_url(
+        config, scopes=["a"], client_id="other", redirect_uri=base["redirect_uri"],
+    ) != first
+    assert build_authorization_url(
+        _config("https://other.example.com/authorize"), scopes=["a"], **base,
+    ) != first
+
+
+def _reference_authorization_url(
+    config: OAuth2Config,
+    *,
+    client_id: str,
+    redirect_uri: str,
+    scopes: list[str] | None = None,
+    state: str | None = None,
+    pkce: PKCEChallenge | None = None,
+) -> str:
+    """The authorization URL as the urlencode-based implementation built it."""
+    params = {
+        "response_type": "code",
+        "client_id": client_id,
+        "redirect_uri": redirect_uri,
+        "scope": " ".join(scopes if scopes else config.scopes),
+    }
+    if state is not None:
+        params["state"] = state
+    if pkce is not None:
+        params["code_challenge"] = pkce.challenge
+        params["code_challenge_method"] = pkce.method
+    separator = "&" if "?" in config.authorization_url else "?"
+    return f"{config.authorization_url}{separator}{urlencode(params)}"
+
+
+@pytest.mark.parametrize("authorization_url", [
+    "https://auth.example.com/authorize",
+    "https://auth.example.com/authorize?tenant=1",
+])
+@pytest.mark.parametrize("client_id", ["client", "c l/i+é"])
+@pytest.mark.parametrize("options", [
+    {},
+    {"scopes": ["read write", "admin:*"]},
+    {"scopes": []},
+    {"state": "s&t=1 ü"},
+    {"state": "", "pkce": PKCEChallenge("verifier", "ch+/=_-", "S256")},
+], ids=["defaults", "scopes", "empty-scopes", "state", "pkce"])
+def test_authorization_url_matches_urlencode(
+    authorization_url: str, client_id: str, options: dict,
+) -> None:
+    config = _config(authorization_url)
+    redirect_uri = "https://agent.example.com/cb?next=/a b"
+    assert build_authorization_url(
+        config, client_id=client_id, redirect_uri=redirect_uri, **options,
+    ) == _reference_authorization_url(
+        config, client_id=client_id, redirect_uri=redirect_uri, **options,
+    )
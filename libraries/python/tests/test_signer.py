@@ -0,0 +1,85 @@
+"""Tests for request signing in :mod:`iajson.auth.signer`."""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import time
+
+import pytest
+
+from iajson.auth.signer import create_signed_headers, sign, verify_signature
+from iajson.exceptions import IaJsonError
+
+SECRET = "s3cret"
+BODY = '{"query": "shoes"}'
+
+
+@pytest.fixture
+def now() -> int:
+    return int(time.time())
+
+
+# -----------------------------------------------------------------------
+# Algorithms
+# -----------------------------------------------------------------------
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512"])
+def test_sign_matches_stdlib_hmac(now: int, algorithm: str) -> None:
+    expected = hmac.new(
+        SECRET.encode(), f"{now}.{BODY}".encode(), getattr(hashlib, algorithm),
+    ).hexdigest()
+    assert sign(SECRET, now, BODY, algorithm=algorithm) == expected
+
+
+@pytest.mark.parametrize("algorithm", ["md5", "sha1", "SHA256", "sha-512", ""])
+def test_unknown_algorithm_is_rejected(now: int, algorithm: str) -> None:
+    with pytest.raises(IaJsonError, match="Unsupported signing algorithm"):
+        sign(SECRET, now, BODY, algorithm=algorithm)  # type: ignore[arg-type]
+    with pytest.raises(IaJsonError, match="Unsupported signing algorithm"):
+        create_signed_headers("key", SECRET, BODY, algorithm=algorithm)  # type: ignore[arg-type]
+    with pytest.raises(IaJsonError, match="Unsupported signing algorithm"):
+        verify_signature(SECRET, now, BODY, "00", algorithm=algorithm)  # type: ignore[arg-type]
+
+
+# -----------------------------------------------------------------------
+# verify_signature
+# -----------------------------------------------------------------------
+
+@pytest.mark.parametrize("algorithm", ["sha256", "sha512"])
+@pytest.mark.parametrize("body", [BODY, BODY.encode(), bytearray(BODY.encode())])
+def test_verify_accepts_own_signature(now: int, algorithm: str, body) -> None:
+    signature = sign(SECRET, now, BODY, algorithm=algorithm)
+    assert verify_signature(SECRET, now, body, signature, algorithm=algorithm)
+
+
+@pytest.mark.parametrize("mangle", [
+    str.upper,
+    lambda sig: sig[:2] + " " + sig[2:],
+    lambda sig: f" {sig}",
+    lambda sig: f"{sig}\n",
+    lambda sig: sig[:-2],
+    lambda sig: sig + "00",
+    lambda sig: sig[:-1] + "g",
+    lambda sig: sig[:-1] + "١",
+    lambda sig: "",
+], ids=[
+    "uppercase", "inner-space", "leading-space", "trailing-newline",
+    "short", "long", "non-hex", "non-ascii-digit", "empty",
+])
+def test_verify_rejects_malformed_signature(now: int, mangle) -> None:
+    signature = sign(SECRET, now, BODY)
+    assert any(c.isalpha() for c in signature)
+    assert not verify_signature(SECRET, now, BODY, mangle(signature))
+
+
+def test_verify_rejects_other_secret(now: int) -> None:
+    signature = sign("other", now, BODY)
+    assert not verify_signature(SECRET, now, BODY, signature)
+
+
+@pytest.mark.parametrize("offset", [-61, 61])
+def test_verify_rejects_stale_or_future_timestamp(now: int, offset: int) -> None:
+    timestamp = now + offset
+    signature = sign(SECRET, timestamp, BODY)
+    assert not verify_signature(SECRET, timestamp, BODY, signature)